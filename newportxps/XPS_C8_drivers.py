@@ -12,12 +12,19 @@
 #       if there is not a valid socket.
 # made many return values "consistent".
 
+import re
 import sys
+import time
 import socket
-from collections import defaultdict
+import threading
+from functools import lru_cache, wraps
 from typing import Callable, Dict, Union, List
 
-from .utils import bytes2str, str2bytes
+from .utils import bytes2str
+
+# one line of the ErrorListGet table: 'Error<code>: <message>'
+_ERROR_LINE = re.compile(r'Error\s*(-?\d+)\s*:\s*([^;]+)')
+
 
 class XPSException(Exception):
     """XPS Controller Exception"""
@@ -41,68 +48,183 @@ class XPSOutputs:
         self.output_parameter_types = output_parameter_types
         for p in output_parameter_types:
             assert p in self._PARSERS, f'Unknown output parameter type {p}'
+        self._parsers = tuple(self._PARSERS[t] for t in output_parameter_types)
+        self._homogeneous = len(set(self._parsers)) == 1
+        self._str = ','.join(f'{c_type} *' for c_type in output_parameter_types)
 
     def __str__(self):
-        return ','.join(f'{c_type} *' for c_type in self.output_parameter_types)
+        return self._str
 
     def parse(self, error: int, response: str):
         if error != 0:
             return [error, response]
 
-        response_parts = response.split(',', len(self.output_parameter_types))
+        parsers = self._parsers
+        nparse = len(parsers)
+        if nparse == 1:
+            # single-value getters are the hottest callers: skip the split
+            head, _, _ = response.partition(',')
+            return [error, parsers[0](head)]
+
+        response_parts = response.split(',', nparse)
         parsed_response: List[Union[bool, str, float, int]] = [error]
-        for i, c_type in enumerate(self.output_parameter_types):
-            parsed_response.append(self._PARSERS[c_type](response_parts[i]))
+        if self._homogeneous:
+            # e.g. ['double']*n: map one callable, no per-field dispatch
+            parsed_response.extend(map(parsers[0], response_parts[:nparse]))
+        else:
+            for parser, part in zip(parsers, response_parts):
+                parsed_response.append(parser(part))
         return parsed_response
 
 
+class XPSBatch:
+    """queue command strings and flush them in one pipelined round-trip
+
+    used through XPS.batch():
+        with xps.batch(socketId) as batch:
+            batch.send('GroupStatusGet(G1,int *)')
+            batch.send('GroupPositionCurrentGet(G1,double *)')
+        results = batch.results    # list of (error, message) pairs
+
+    results is filled on leaving the block (None if the block raised).
+    """
+    def __init__(self, xps, socketId):
+        self._xps = xps
+        self._socketId = socketId
+        self._cmds = []
+        self.results = None
+
+    def send(self, cmd):
+        "queue a command for the batched flush"
+        self._cmds.append(cmd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and len(self._cmds) > 0:
+            self.results = self._xps.Send_batch(self._socketId, self._cmds)
+        return False
+
+
+@lru_cache(maxsize=256)
+def _outputs_cached(*output_parameter_types: str) -> XPSOutputs:
+    """memoized XPSOutputs constructor: the same output signatures
+    recur on every call in polling loops"""
+    return XPSOutputs(*output_parameter_types)
+
+
 class XPS:
     # Defines
     MAX_NB_SOCKETS = 100
 
+    # gathering replies mix commas, semicolons, tabs and newlines
+    _GATHER_DELIMS = str.maketrans(',;\r\t\n', '     ')
+
+    # parsed ErrorListGet tables, shared across instances (the table
+    # only varies with controller firmware)
+    _errorcodes_cache = {}
+
     # Global variables
     __sockets = {}
-    __usedSockets = defaultdict(int)
+    __rfiles = {}
+    __locks = {}
+    __usedSockets = bytearray(MAX_NB_SOCKETS)
     __nbSockets = 0
 
     # Initialization Function
-    def __init__ (self):
+    def __init__ (self, socket_options=None, profile=False):
+        """socket_options: optional list of (level, optname, value) tuples
+        applied to each new socket, in addition to TCP_NODELAY
+        (example: [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+        profile: collect per-call send/wait timing, see stats()
+        """
         self.errorcodes = {}
+        self._string_cache = {}
+        self._profile = profile
+        self._stats = {'calls': 0, 'send_ns': 0, 'wait_ns': 0}
+        self.socket_options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                               (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                               (socket.SOL_SOCKET, socket.SO_SNDBUF, 262144),
+                               (socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)]
+        # keepalive probe timing (Linux): detect a dead link in ~90 s
+        # instead of waiting for a recv timeout months into a scan
+        for optname, value in (('TCP_KEEPIDLE', 60), ('TCP_KEEPINTVL', 10),
+                               ('TCP_KEEPCNT', 3)):
+            if hasattr(socket, optname):
+                self.socket_options.append((socket.IPPROTO_TCP,
+                                            getattr(socket, optname), value))
+        if socket_options is not None:
+            self.socket_options.extend(socket_options)
 
     def withValidSocket(fcn):
         """ decorator to ensure that a valid socket is passed as the
         first argument of the decorated function"""
-        def wrapper(*args, **kw):
-            try:
-                sid = args[1]
-                if XPS.__usedSockets[sid] == 0:
-                    raise XPSException('invalid socket at function %s' % fcn.__name__)
-            except IndexError:
-                raise XPSException('no socket specified for fucntion %s' % fcn.__name__)
-            return fcn(*args, **kw)
-        wrapper.__doc__ = fcn.__doc__
-        wrapper.__name__ = fcn.__name__
-        wrapper.__dict__.update(fcn.__dict__)
+        @wraps(fcn)
+        def wrapper(self, socketId, *args, **kw):
+            if not (0 <= socketId < XPS.MAX_NB_SOCKETS
+                    and XPS.__usedSockets[socketId]):
+                raise XPSException('invalid socket at function %s' % fcn.__name__)
+            return fcn(self, socketId, *args, **kw)
         return wrapper
 
+    @staticmethod
+    def __readReply(rfile, buf):
+        """drain rfile until the next ',EndOfAPI' terminator, starting
+        from any leftover bytes in buf.
+        returns (error, message, leftover) with leftover holding bytes
+        of the following reply (for pipelined commands)"""
+        suffix = b',EndOfAPI'
+        idx = buf.find(suffix)
+        while idx == -1:
+            chunk = rfile.read1(65536)
+            if not chunk:
+                return -2, '', bytearray()
+            nbefore = len(buf)
+            buf += chunk
+            # search only new bytes (and a suffix-length overlap)
+            idx = buf.find(suffix, max(0, nbefore - len(suffix) + 1))
+        error, rest = bytes2str(bytes(buf[:idx])).split(',', 1)
+        return int(error), rest, buf[idx+len(suffix):]
+
     # Send command and get return
     @withValidSocket
     def __sendAndReceive (self, socketId, command):
         # print("SEND REC ", command, type(command))
-        suffix = ',EndOfAPI'
+        # the per-socket lock keeps request/reply framing intact when
+        # several threads share one socketId; calls on distinct
+        # socketIds still run concurrently
+        if not isinstance(command, bytes):
+            # commands are pure ASCII; callers may pass pre-encoded bytes
+            command = command.encode('ascii', 'replace')
         try:
-            XPS.__sockets[socketId].send(str2bytes(command))
-            ret = bytes2str(XPS.__sockets[socketId].recv(1024))
-            while (ret.find(suffix) == -1):
-                ret += bytes2str(XPS.__sockets[socketId].recv(1024))
+            with XPS.__locks[socketId]:
+                if self._profile:
+                    t0 = time.perf_counter_ns()
+                    XPS.__sockets[socketId].sendall(command)
+                    t1 = time.perf_counter_ns()
+                    error, rest, _ = self.__readReply(XPS.__rfiles[socketId], bytearray())
+                    st = self._stats
+                    st['calls'] += 1
+                    st['send_ns'] += t1 - t0
+                    st['wait_ns'] += time.perf_counter_ns() - t1
+                else:
+                    XPS.__sockets[socketId].sendall(command)
+                    error, rest, _ = self.__readReply(XPS.__rfiles[socketId], bytearray())
         except socket.timeout:
             return -2, ''
         except socket.error as err: #  (errNb, errString):
             print( 'Socket error : ', err.errno, err)
             return -2, ''
+        return error, rest
 
-        error, rest = ret[:-len(suffix)].split(',', 1)
-        return int(error), rest
+    def stats(self):
+        """cumulative Send timing collected with XPS(profile=True):
+        {'calls', 'send_ns', 'wait_ns'} -- wait_ns is time blocked on
+        the controller's reply, the usual bottleneck on a LAN.  Use it
+        to decide whether a slow loop needs batching (wait-bound) or
+        lighter parsing (CPU-bound)"""
+        return dict(self._stats)
 
     def Send(self, socketId=None, cmd=None, check=False):
         """send and receive command cmd from socketId
@@ -117,36 +239,95 @@ class XPS:
             raise XPSException(msg)
         return err, msg
 
+    def Send_batch(self, socketId=None, cmds=None, check=False):
+        """send several commands in a single socket write and read one
+        reply per command: pipelining amortizes the network round-trip
+        over the whole batch.
+        Returns a list of (error, message) pairs, one per command.
+        with check=True, an XPSException will be raised on the first error.
+
+        The controller answers commands on one socket strictly in
+        order, so pipelining on a single persistent socket gives the
+        same read throughput as opening one socket per in-flight
+        command, without burning extra connects against the
+        controller's socket limit.
+        """
+        if socketId is None:
+            socketId = self.socketId
+        self.socketId = socketId
+        if XPS.__usedSockets[socketId] == 0:
+            raise XPSException('invalid socket at function Send_batch')
+
+        out = []
+        try:
+            with XPS.__locks[socketId]:
+                XPS.__sockets[socketId].sendall(
+                    b''.join(c if isinstance(c, bytes) else c.encode('ascii', 'replace')
+                             for c in cmds))
+                rfile = XPS.__rfiles[socketId]
+                buf = bytearray()
+                for _ in cmds:
+                    err, msg, buf = self.__readReply(rfile, buf)
+                    out.append((err, msg))
+        except socket.timeout:
+            out.extend([(-2, '')] * (len(cmds) - len(out)))
+        except socket.error as err:
+            print( 'Socket error : ', err.errno, err)
+            out.extend([(-2, '')] * (len(cmds) - len(out)))
+        if check:
+            for err, msg in out:
+                if err != 0:
+                    raise XPSException(msg)
+        return out
+
+    def batch(self, socketId=None):
+        """context manager collecting commands for one pipelined
+        round-trip; commands are flushed with Send_batch on exit
+        """
+        if socketId is None:
+            socketId = self.socketId
+        return XPSBatch(self, socketId)
+
     # TCP_ConnectToServer
     def TCP_ConnectToServer (self, IP, port, timeOut):
-        socketId = 0
-        if (XPS.__nbSockets < self.MAX_NB_SOCKETS):
-            while (XPS.__usedSockets[socketId] == 1 and socketId < self.MAX_NB_SOCKETS):
-                socketId += 1
-                self.socketId = socketId
-            if (socketId == self.MAX_NB_SOCKETS):
-                return -1
-        else:
+        socketId = XPS.__usedSockets.find(b'\x00')
+        if socketId == -1:
             return -1
 
         XPS.__usedSockets[socketId] = 1
         XPS.__nbSockets += 1
+        self.socketId = socketId
         try:
             XPS.__sockets[socketId] = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # disable Nagle: XPS commands are short and latency-bound
+            for level, optname, value in self.socket_options:
+                try:
+                    XPS.__sockets[socketId].setsockopt(level, optname, value)
+                except OSError:
+                    pass
             XPS.__sockets[socketId].connect((IP, port))
             XPS.__sockets[socketId].settimeout(timeOut)
-            XPS.__sockets[socketId].setblocking(1)
+            XPS.__rfiles[socketId] = XPS.__sockets[socketId].makefile('rb', buffering=65536)
+            XPS.__locks[socketId] = threading.Lock()
         except socket.error:
+            # release the slot: a failed connect must not leak socket state
+            sock = XPS.__sockets.pop(socketId, None)
+            if sock is not None:
+                sock.close()
+            XPS.__rfiles.pop(socketId, None)
+            XPS.__locks.pop(socketId, None)
+            XPS.__usedSockets[socketId] = 0
+            XPS.__nbSockets -= 1
             return -1
 
+        self._string_cache.clear()
         err, ret = self.ErrorListGet(socketId)
-        self.errorcodes = {}
-        for cline in ret.split(';'):
-            if ':' in cline:
-                ecode, message = cline.split(':', 1)
-                ecode = ecode.replace('Error', '').strip()
-                message = message.strip()
-                self.errorcodes[ecode] = message
+        errorcodes = XPS._errorcodes_cache.get(ret)
+        if errorcodes is None:
+            errorcodes = {code: message.strip()
+                          for code, message in _ERROR_LINE.findall(ret)}
+            XPS._errorcodes_cache[ret] = errorcodes
+        self.errorcodes = errorcodes
 
         return socketId
 
@@ -159,6 +340,10 @@ class XPS:
     def TCP_CloseSocket (self, socketId):
         if (socketId >= 0 and socketId < self.MAX_NB_SOCKETS):
             try:
+                XPS.__locks.pop(socketId, None)
+                rfile = XPS.__rfiles.pop(socketId, None)
+                if rfile is not None:
+                    rfile.close()
                 XPS.__sockets[socketId].close()
                 XPS.__usedSockets[socketId] = 0
                 XPS.__nbSockets -= 1
@@ -171,14 +356,14 @@ class XPS:
 
     # ControllerMotionKernelTimeLoadGet :  Get controller motion kernel time load
     def ControllerMotionKernelTimeLoadGet(self, socketId=None):
-        outputs = XPSOutputs("double", 'double', 'double', 'double')
+        outputs = _outputs_cached("double", 'double', 'double', 'double')
         command = f'ControllerMotionKernelTimeLoadGet({outputs})'
         error, returnedString = self.Send(socketId=socketId, cmd=command)
         return outputs.parse(error, returnedString)
 
     # ControllerStatusGet :  Read controller current status
     def ControllerStatusGet(self, socketId=None):
-        outputs = XPSOutputs('int')
+        outputs = _outputs_cached('int')
         error, returnedString = self.Send(socketId=socketId,
                                           cmd=f'ControllerStatusGet({outputs})', check=True)
         return outputs.parse(error, returnedString)
@@ -190,7 +375,7 @@ class XPS:
 
     # ElapsedTimeGet :  Return elapsed time from controller power on
     def ElapsedTimeGet(self, socketId=None):
-        outputs = XPSOutputs('double')
+        outputs = _outputs_cached('double')
         command = f'ElapsedTimeGet({outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -205,8 +390,7 @@ class XPS:
 
     # TCLScriptExecute :  Execute a TCL script from a TCL file
     def TCLScriptExecute (self, socketId, TCLFileName, TaskName, ParametersList):
-        command = 'TCLScriptExecute(' + TCLFileName + ',' + TaskName + ',' + ParametersList + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'TCLScriptExecute', TCLFileName, TaskName, ParametersList)
 
     # TCLScriptExecuteAndWait :  Execute a TCL script from a TCL file and wait the end of execution to return
     def TCLScriptExecuteAndWait (self, socketId, TCLFileName, TaskName, InputParametersList):
@@ -215,17 +399,15 @@ class XPS:
 
     # TCLScriptExecuteWithPriority :  Execute a TCL script with defined priority
     def TCLScriptExecuteWithPriority (self, socketId, TCLFileName, TaskName, TaskPriorityLevel, ParametersList):
-        command = 'TCLScriptExecuteWithPriority(' + TCLFileName + ',' + TaskName + ',' + TaskPriorityLevel + ',' + ParametersList + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'TCLScriptExecuteWithPriority', TCLFileName, TaskName, TaskPriorityLevel, ParametersList)
 
     # TCLScriptKill :  Kill TCL Task
     def TCLScriptKill (self, socketId, TaskName):
-        command = 'TCLScriptKill(' + TaskName + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'TCLScriptKill', TaskName)
 
     # TimerGet :  Get a timer
     def TimerGet (self, socketId, TimerName):
-        outputs = XPSOutputs('int')
+        outputs = _outputs_cached('int')
         command = f'TimerGet({TimerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -256,8 +438,7 @@ class XPS:
 
     # EventAdd :  ** OBSOLETE ** Add an event
     def EventAdd (self, socketId, PositionerName, EventName, EventParameter, ActionName, ActionParameter1, ActionParameter2, ActionParameter3):
-        command = 'EventAdd(' + PositionerName + ',' + EventName + ',' + EventParameter + ',' + ActionName + ',' + ActionParameter1 + ',' + ActionParameter2 + ',' + ActionParameter3 + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'EventAdd', PositionerName, EventName, EventParameter, ActionName, ActionParameter1, ActionParameter2, ActionParameter3)
 
     # EventGet :  ** OBSOLETE ** Read events and actions list
     def EventGet (self, socketId, PositionerName):
@@ -266,24 +447,18 @@ class XPS:
 
     # EventRemove :  ** OBSOLETE ** Delete an event
     def EventRemove (self, socketId, PositionerName, EventName, EventParameter):
-        command = 'EventRemove(' + PositionerName + ',' + EventName + ',' + EventParameter + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'EventRemove', PositionerName, EventName, EventParameter)
 
     # EventWait :  ** OBSOLETE ** Wait an event
     def EventWait (self, socketId, PositionerName, EventName, EventParameter):
-        command = 'EventWait(' + PositionerName + ',' + EventName + ',' + EventParameter + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'EventWait', PositionerName, EventName, EventParameter)
 
     # EventExtendedConfigurationTriggerSet :  Configure one or several events
     def EventExtendedConfigurationTriggerSet (self, socketId, ExtendedEventName, EventParameter1, EventParameter2, EventParameter3, EventParameter4):
-        command = 'EventExtendedConfigurationTriggerSet('
-        for i in range(len(ExtendedEventName)):
-            if (i > 0):
-                command += ','
-            command += ExtendedEventName[i] + ',' + EventParameter1[i] + ',' + EventParameter2[i] + ',' + EventParameter3[i] + ',' + EventParameter4[i]
-        command += ')'
-
-        return self.Send(socketId, command)
+        events = ','.join(f'{name},{p1},{p2},{p3},{p4}' for name, p1, p2, p3, p4 in
+                          zip(ExtendedEventName, EventParameter1, EventParameter2,
+                              EventParameter3, EventParameter4))
+        return self.Send(socketId, f'EventExtendedConfigurationTriggerSet({events})')
 
     # EventExtendedConfigurationTriggerGet :  Read the event configuration
     def EventExtendedConfigurationTriggerGet (self, socketId):
@@ -292,14 +467,10 @@ class XPS:
 
     # EventExtendedConfigurationActionSet :  Configure one or several actions
     def EventExtendedConfigurationActionSet (self, socketId, ExtendedActionName, ActionParameter1, ActionParameter2, ActionParameter3, ActionParameter4):
-        command = 'EventExtendedConfigurationActionSet('
-        for i in range(len(ExtendedActionName)):
-            if (i > 0):
-                command += ','
-            command += ExtendedActionName[i] + ',' + ActionParameter1[i] + ',' + ActionParameter2[i] + ',' + ActionParameter3[i] + ',' + ActionParameter4[i]
-        command += ')'
-
-        return self.Send(socketId, command)
+        actions = ','.join(f'{name},{p1},{p2},{p3},{p4}' for name, p1, p2, p3, p4 in
+                           zip(ExtendedActionName, ActionParameter1, ActionParameter2,
+                               ActionParameter3, ActionParameter4))
+        return self.Send(socketId, f'EventExtendedConfigurationActionSet({actions})')
 
 
     # EventExtendedConfigurationActionGet :  Read the action configuration
@@ -308,7 +479,7 @@ class XPS:
 
     # EventExtendedStart :  Launch the last event and action configuration and return an ID
     def EventExtendedStart (self, socketId):
-        outputs = XPSOutputs('int')
+        outputs = _outputs_cached('int')
         command = f'EventExtendedStart({outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -335,17 +506,11 @@ class XPS:
 
     # GatheringConfigurationSet :  Configuration acquisition
     def GatheringConfigurationSet (self, socketId, Type):
-        command = 'GatheringConfigurationSet('
-        for i in range(len(Type)):
-            if (i > 0):
-                command += ','
-            command += Type[i]
-        command += ')'
-        return self.Send(socketId, command)
+        return self.Send(socketId, 'GatheringConfigurationSet(%s)' % ','.join(Type))
 
     # GatheringCurrentNumberGet :  Maximum number of samples and current number during acquisition
     def GatheringCurrentNumberGet (self, socketId):
-        outputs = XPSOutputs('int', 'int')
+        outputs = _outputs_cached('int', 'int')
         command = f'GatheringCurrentNumberGet({outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -368,14 +533,27 @@ class XPS:
         command = 'GatheringDataMultipleLinesGet(' + str(IndexPoint) + ',' + str(NumberOfLines) + ',char *)'
         return self.Send(socketId, command)
 
+    # GatheringDataMultipleLinesGetArray :  Get multiple data lines from
+    # gathering buffer, parsed to a numpy array of doubles.  With ncols, the
+    # array is reshaped to one row per gathered line.
+    def GatheringDataMultipleLinesGetArray (self, socketId, IndexPoint, NumberOfLines, ncols=None):
+        import numpy as np
+        error, ret = self.GatheringDataMultipleLinesGet(socketId, IndexPoint, NumberOfLines)
+        if error != 0:
+            return error, ret
+        # one C-level parse instead of a float() call per value
+        data = np.fromstring(ret.translate(self._GATHER_DELIMS), sep=' ')
+        if ncols is not None and data.size % ncols == 0:
+            data = data.reshape(-1, ncols)
+        return error, data
+
     # GatheringReset :  Empty the gathered data in memory to start new gathering from scratch
     def GatheringReset(self, socketId):
         return self.Send(socketId, 'GatheringReset()')
 
     # GatheringRun :  Start a new gathering
     def GatheringRun (self, socketId, DataNumber, Divisor):
-        command = 'GatheringRun(' + str(DataNumber) + ',' + str(Divisor) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'GatheringRun', DataNumber, Divisor)
 
 
     # GatheringRunAppend :  Re-start the stopped gathering to add new data
@@ -388,14 +566,7 @@ class XPS:
 
     # GatheringExternalConfigurationSet :  Configuration acquisition
     def GatheringExternalConfigurationSet (self, socketId, Type):
-        command = 'GatheringExternalConfigurationSet('
-        for i in range(len(Type)):
-            if (i > 0):
-                command += ','
-            command += Type[i]
-        command += ')'
-
-        return self.Send(socketId, command)
+        return self.Send(socketId, 'GatheringExternalConfigurationSet(%s)' % ','.join(Type))
 
     # GatheringExternalConfigurationGet :  Read different mnemonique type
     def GatheringExternalConfigurationGet (self, socketId):
@@ -403,7 +574,7 @@ class XPS:
 
     # GatheringExternalCurrentNumberGet :  Maximum number of samples and current number during acquisition
     def GatheringExternalCurrentNumberGet (self, socketId):
-        outputs = XPSOutputs('int', 'int')
+        outputs = _outputs_cached('int', 'int')
         command = f'GatheringExternalCurrentNumberGet({outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -422,71 +593,48 @@ class XPS:
 
     # GlobalArraySet :  Set global array value
     def GlobalArraySet (self, socketId, Number, ValueString):
-        command = 'GlobalArraySet(' + str(Number) + ',' + ValueString + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'GlobalArraySet', Number, ValueString)
 
     # DoubleGlobalArrayGet :  Get double global array value
     def DoubleGlobalArrayGet (self, socketId, Number):
-        outputs = XPSOutputs('double')
+        outputs = _outputs_cached('double')
         command = f'DoubleGlobalArrayGet({Number},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # DoubleGlobalArraySet :  Set double global array value
     def DoubleGlobalArraySet (self, socketId, Number, DoubleValue):
-        command = 'DoubleGlobalArraySet(' + str(Number) + ',' + str(DoubleValue) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'DoubleGlobalArraySet', Number, DoubleValue)
 
     # GPIOAnalogGet :  Read analog input or analog output for one or few input
     def GPIOAnalogGet (self, socketId, GPIOName):
-        outputs = XPSOutputs(*(['double'] * len(GPIOName)))
-        command = 'GPIOAnalogGet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + 'double *'
-        command += ')'
-
+        outputs = _outputs_cached(*(['double'] * len(GPIOName)))
+        command = 'GPIOAnalogGet(%s)' % ','.join(f'{name},double *' for name in GPIOName)
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # GPIOAnalogSet :  Set analog output for one or few output
     def GPIOAnalogSet (self, socketId, GPIOName, AnalogOutputValue):
-        command = 'GPIOAnalogSet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + str(AnalogOutputValue[i])
-        command += ')'
+        command = 'GPIOAnalogSet(%s)' % ','.join(f'{name},{val}' for name, val in
+                                                 zip(GPIOName, AnalogOutputValue))
         return self.Send(socketId, command)
 
     # GPIOAnalogGainGet :  Read analog input gain (1, 2, 4 or 8) for one or few input
     def GPIOAnalogGainGet (self, socketId, GPIOName):
-        outputs = XPSOutputs(*(['int'] * len(GPIOName)))
-        command = 'GPIOAnalogGainGet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + 'int *'
-        command += ')'
-
+        outputs = _outputs_cached(*(['int'] * len(GPIOName)))
+        command = 'GPIOAnalogGainGet(%s)' % ','.join(f'{name},int *' for name in GPIOName)
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # GPIOAnalogGainSet :  Set analog input gain (1, 2, 4 or 8) for one or few input
     def GPIOAnalogGainSet (self, socketId, GPIOName, AnalogInputGainValue):
-        command = 'GPIOAnalogGainSet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + str(AnalogInputGainValue[i])
-        command += ')'
-
+        command = 'GPIOAnalogGainSet(%s)' % ','.join(f'{name},{gain}' for name, gain in
+                                                     zip(GPIOName, AnalogInputGainValue))
         return self.Send(socketId, command)
 
     # GPIODigitalGet :  Read digital output or digital input
     def GPIODigitalGet (self, socketId, GPIOName):
-        outputs = XPSOutputs('unsigned short')
+        outputs = _outputs_cached('unsigned short')
         command = f'GPIODigitalGet({GPIOName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -494,41 +642,51 @@ class XPS:
 
     # GPIODigitalSet :  Set Digital Output for one or few output TTL
     def GPIODigitalSet (self, socketId, GPIOName, Mask, DigitalOutputValue):
-        command = 'GPIODigitalSet(' + GPIOName + ',' + str(Mask) + ',' + str(DigitalOutputValue) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'GPIODigitalSet', GPIOName, Mask, DigitalOutputValue)
+
+    def _fixed_double_read(self, socketId, fn_name, group, nbElement):
+        """shared implementation for the Group...Get readbacks returning
+        nbElement doubles; uses the cached per-arity output signature"""
+        outputs = _outputs_cached(*(['double'] * nbElement))
+        error, returnedString = self.Send(socketId, f'{fn_name}({group},{outputs})')
+        return outputs.parse(error, returnedString)
+
+    def _send_args(self, socketId, fn_name, *args):
+        """assemble 'fn_name(arg,arg,...)' with a single C-level join
+        and send it"""
+        return self.Send(socketId, '%s(%s)' % (fn_name, ','.join(map(str, args))))
+
+    def _cached_string_get(self, socketId, key, command):
+        """memoized code-to-string lookup: the mapping is fixed for a
+        given firmware, so repeated polls skip the round-trip.
+        cleared on reconnect"""
+        hit = self._string_cache.get(key)
+        if hit is not None:
+            return hit
+        ret = self.Send(socketId, command)
+        if ret[0] == 0:
+            self._string_cache[key] = ret
+        return ret
 
     # GroupAccelerationSetpointGet :  Return setpoint accelerations
     def GroupAccelerationSetpointGet (self, socketId, GroupName, nbElement):
-        outputs = XPSOutputs(*(['double'] * nbElement))
-        command = f'GroupAccelerationSetpointGet({GroupName},{outputs})'
-
-        error, returnedString = self.Send(socketId, command)
-        return outputs.parse(error, returnedString)
+        return self._fixed_double_read(socketId, 'GroupAccelerationSetpointGet', GroupName, nbElement)
 
     # GroupAnalogTrackingModeEnable :  Enable Analog Tracking mode on selected group
     def GroupAnalogTrackingModeEnable (self, socketId, GroupName, Type):
-        command = 'GroupAnalogTrackingModeEnable(' + GroupName + ',' + Type + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'GroupAnalogTrackingModeEnable', GroupName, Type)
 
     # GroupAnalogTrackingModeDisable :  Disable Analog Tracking mode on selected group
     def GroupAnalogTrackingModeDisable (self, socketId, GroupName):
-        command = 'GroupAnalogTrackingModeDisable(' + GroupName + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'GroupAnalogTrackingModeDisable', GroupName)
 
     # GroupCorrectorOutputGet :  Return corrector outputs
     def GroupCorrectorOutputGet (self, socketId, GroupName, nbElement):
-        outputs = XPSOutputs(*(['double'] * nbElement))
-        command = f'GroupCorrectorOutputGet({GroupName},{outputs})'
-        error, returnedString = self.Send(socketId, command)
-        return outputs.parse(error, returnedString)
+        return self._fixed_double_read(socketId, 'GroupCorrectorOutputGet', GroupName, nbElement)
 
     # GroupCurrentFollowingErrorGet :  Return current following errors
     def GroupCurrentFollowingErrorGet (self, socketId, GroupName, nbElement):
-        outputs = XPSOutputs(*(['double'] * nbElement))
-        command = f'GroupCurrentFollowingErrorGet({GroupName},{outputs})'
-
-        error, returnedString = self.Send(socketId, command)
-        return outputs.parse(error, returnedString)
+        return self._fixed_double_read(socketId, 'GroupCurrentFollowingErrorGet', GroupName, nbElement)
 
     # GroupHomeSearch :  Start home search sequence
     def GroupHomeSearch (self, socketId, GroupName):
@@ -536,12 +694,7 @@ class XPS:
 
     # GroupHomeSearchAndRelativeMove :  Start home search sequence and execute a displacement
     def GroupHomeSearchAndRelativeMove (self, socketId, GroupName, TargetDisplacement):
-        command = 'GroupHomeSearchAndRelativeMove(' + GroupName + ','
-        for i in range(len(TargetDisplacement)):
-            if (i > 0):
-                command += ','
-            command += str(TargetDisplacement[i])
-        command += ')'
+        command = f"GroupHomeSearchAndRelativeMove({GroupName},{','.join(map(str, TargetDisplacement))})"
         return self.Send(socketId, command)
 
     # GroupInitialize :  Start the initialization
@@ -554,29 +707,16 @@ class XPS:
 
     # GroupJogParametersSet :  Modify Jog parameters on selected group and activate the continuous move
     def GroupJogParametersSet (self, socketId, GroupName, Velocity, Acceleration):
-        command = 'GroupJogParametersSet(' + GroupName + ','
-        for i in range(len(Velocity)):
-            if (i > 0):
-                command += ','
-            command += str(Velocity[i]) + ',' + str(Acceleration[i])
-        command += ')'
-        return self.Send(socketId, command)
+        params = ','.join(f'{velo},{accel}' for velo, accel in zip(Velocity, Acceleration))
+        return self.Send(socketId, f'GroupJogParametersSet({GroupName},{params})')
 
     # GroupJogParametersGet :  Get Jog parameters on selected group
     def GroupJogParametersGet (self, socketId, GroupName, nbElement):
-        outputs = XPSOutputs(*(['double'] * 2 * nbElement))
-        command = f'GroupJogParametersGet({GroupName},{outputs})'
-
-        error, returnedString = self.Send(socketId, command)
-        return outputs.parse(error, returnedString)
+        return self._fixed_double_read(socketId, 'GroupJogParametersGet', GroupName, 2 * nbElement)
 
     # GroupJogCurrentGet :  Get Jog current on selected group
     def GroupJogCurrentGet (self, socketId, GroupName, nbElement):
-        outputs = XPSOutputs(*(['double'] * 2 * nbElement))
-        command = f'GroupJogCurrentGet({GroupName},{outputs})'
-
-        error, returnedString = self.Send(socketId, command)
-        return outputs.parse(error, returnedString)
+        return self._fixed_double_read(socketId, 'GroupJogCurrentGet', GroupName, 2 * nbElement)
 
     # GroupJogModeEnable :  Enable Jog mode on selected group
     def GroupJogModeEnable (self, socketId, GroupName):
@@ -597,22 +737,12 @@ class XPS:
 
     # GroupMoveAbsolute :  Do an absolute move
     def GroupMoveAbsolute (self, socketId, GroupName, TargetPosition):
-        command = 'GroupMoveAbsolute(' + GroupName + ','
-        for i in range(len(TargetPosition)):
-            if (i > 0):
-                command += ','
-            command += str(TargetPosition[i])
-        command += ')'
+        command = f"GroupMoveAbsolute({GroupName},{','.join(map(str, TargetPosition))})"
         return self.Send(socketId, command)
 
     # GroupMoveRelative :  Do a relative move
     def GroupMoveRelative (self, socketId, GroupName, TargetDisplacement):
-        command = 'GroupMoveRelative(' + GroupName + ','
-        for i in range(len(TargetDisplacement)):
-            if (i > 0):
-                command += ','
-            command += str(TargetDisplacement[i])
-        command += ')'
+        command = f"GroupMoveRelative({GroupName},{','.join(map(str, TargetDisplacement))})"
         return self.Send(socketId, command)
 
     # GroupMotionDisable :  Set Motion disable on selected group
@@ -626,22 +756,18 @@ class XPS:
 
     # GroupPositionCorrectedProfilerGet :  Return corrected profiler positions
     def GroupPositionCorrectedProfilerGet (self, socketId, GroupName, PositionX, PositionY):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'GroupPositionCorrectedProfilerGet({GroupName},{PositionX},{PositionY},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # GroupPositionCurrentGet :  Return current positions
     def GroupPositionCurrentGet (self, socketId, GroupName, nbElement):
-        outputs = XPSOutputs(*(['double'] * nbElement))
-        command = f'GroupPositionCurrentGet({GroupName},{outputs})'
-
-        error, returnedString = self.Send(socketId, command)
-        return outputs.parse(error, returnedString)
+        return self._fixed_double_read(socketId, 'GroupPositionCurrentGet', GroupName, nbElement)
 
     # GroupPositionPCORawEncoderGet :  Return PCO raw encoder positions
     def GroupPositionPCORawEncoderGet (self, socketId, GroupName, PositionX, PositionY):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'GroupPositionPCORawEncoderGet({GroupName},{PositionX},{PositionY},{outputs})'
 
         error, returnedString = self.Send(socketId, command)
@@ -649,24 +775,15 @@ class XPS:
 
     # GroupPositionSetpointGet :  Return setpoint positions
     def GroupPositionSetpointGet (self, socketId, GroupName, nbElement):
-        outputs = XPSOutputs(*(['double'] * nbElement))
-        command = f'GroupPositionSetpointGet({GroupName},{outputs})'
-
-        error, returnedString = self.Send(socketId, command)
-        return outputs.parse(error, returnedString)
+        return self._fixed_double_read(socketId, 'GroupPositionSetpointGet', GroupName, nbElement)
 
     # GroupPositionTargetGet :  Return target positions
     def GroupPositionTargetGet (self, socketId, GroupName, nbElement):
-        outputs = XPSOutputs(*(['double'] * nbElement))
-        command = f'GroupPositionTargetGet({GroupName},{outputs})'
-
-        error, returnedString = self.Send(socketId, command)
-        return outputs.parse(error, returnedString)
+        return self._fixed_double_read(socketId, 'GroupPositionTargetGet', GroupName, nbElement)
 
     # GroupReferencingActionExecute :  Execute an action in referencing mode
     def GroupReferencingActionExecute (self, socketId, PositionerName, ReferencingAction, ReferencingSensor, ReferencingParameter):
-        command = 'GroupReferencingActionExecute(' + PositionerName + ',' + ReferencingAction + ',' + ReferencingSensor + ',' + str(ReferencingParameter) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'GroupReferencingActionExecute', PositionerName, ReferencingAction, ReferencingSensor, ReferencingParameter)
 
     # GroupReferencingStart :  Enter referencing mode
     def GroupReferencingStart (self, socketId, GroupName):
@@ -678,22 +795,19 @@ class XPS:
 
     # GroupStatusGet :  Return group status
     def GroupStatusGet (self, socketId, GroupName):
-        outputs = XPSOutputs('int')
+        outputs = _outputs_cached('int')
         command = f'GroupStatusGet({GroupName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # GroupStatusStringGet :  Return the group status string corresponding to the group status code
     def GroupStatusStringGet (self, socketId, GroupStatusCode):
-        return self.Send(socketId, 'GroupStatusStringGet(%s, char*)'  % str(GroupStatusCode))
+        return self._cached_string_get(socketId, ('GroupStatus', GroupStatusCode),
+                                       'GroupStatusStringGet(%s, char*)'  % str(GroupStatusCode))
 
     # GroupVelocityCurrentGet :  Return current velocities
     def GroupVelocityCurrentGet (self, socketId, GroupName, nbElement):
-        outputs = XPSOutputs(*(['double'] * nbElement))
-        command = f'GroupVelocityCurrentGet({GroupName},{outputs})'
-
-        error, returnedString = self.Send(socketId, command)
-        return outputs.parse(error, returnedString)
+        return self._fixed_double_read(socketId, 'GroupVelocityCurrentGet', GroupName, nbElement)
 
     # KillAll :  Put all groups in 'Not initialized' state
     def KillAll (self, socketId):
@@ -701,39 +815,36 @@ class XPS:
 
     # PositionerAnalogTrackingPositionParametersGet :  Read dynamic parameters for one axe of a group for a future analog tracking position
     def PositionerAnalogTrackingPositionParametersGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('char', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('char', 'double', 'double', 'double', 'double')
         command = f'PositionerAnalogTrackingPositionParametersGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerAnalogTrackingPositionParametersSet :  Update dynamic parameters for one axe of a group for a future analog tracking position
     def PositionerAnalogTrackingPositionParametersSet (self, socketId, PositionerName, GPIOName, Offset, Scale, Velocity, Acceleration):
-        command = 'PositionerAnalogTrackingPositionParametersSet(' + PositionerName + ',' + GPIOName + ',' + str(Offset) + ',' + str(Scale) + ',' + str(Velocity) + ',' + str(Acceleration) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerAnalogTrackingPositionParametersSet', PositionerName, GPIOName, Offset, Scale, Velocity, Acceleration)
 
     # PositionerAnalogTrackingVelocityParametersGet :  Read dynamic parameters for one axe of a group for a future analog tracking velocity
     def PositionerAnalogTrackingVelocityParametersGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('char', 'double', 'double', 'double', 'int', 'double', 'double')
+        outputs = _outputs_cached('char', 'double', 'double', 'double', 'int', 'double', 'double')
         command = f'PositionerAnalogTrackingVelocityParametersGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerAnalogTrackingVelocityParametersSet :  Update dynamic parameters for one axe of a group for a future analog tracking velocity
     def PositionerAnalogTrackingVelocityParametersSet (self, socketId, PositionerName, GPIOName, Offset, Scale, DeadBandThreshold, Order, Velocity, Acceleration):
-        command = 'PositionerAnalogTrackingVelocityParametersSet(' + PositionerName + ',' + GPIOName + ',' + str(Offset) + ',' + str(Scale) + ',' + str(DeadBandThreshold) + ',' + str(Order) + ',' + str(Velocity) + ',' + str(Acceleration) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerAnalogTrackingVelocityParametersSet', PositionerName, GPIOName, Offset, Scale, DeadBandThreshold, Order, Velocity, Acceleration)
 
     # PositionerBacklashGet :  Read backlash value and status
     def PositionerBacklashGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'char')
+        outputs = _outputs_cached('double', 'char')
         command = f'PositionerBacklashGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerBacklashSet :  Set backlash value
     def PositionerBacklashSet (self, socketId, PositionerName, BacklashValue):
-        command = 'PositionerBacklashSet(' + PositionerName + ',' + str(BacklashValue) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerBacklashSet', PositionerName, BacklashValue)
 
     # PositionerBacklashEnable :  Enable the backlash
     def PositionerBacklashEnable (self, socketId, PositionerName):
@@ -745,12 +856,11 @@ class XPS:
 
     # PositionerCorrectorNotchFiltersSet :  Update filters parameters
     def PositionerCorrectorNotchFiltersSet (self, socketId, PositionerName, NotchFrequency1, NotchBandwith1, NotchGain1, NotchFrequency2, NotchBandwith2, NotchGain2):
-        command = 'PositionerCorrectorNotchFiltersSet(' + PositionerName + ',' + str(NotchFrequency1) + ',' + str(NotchBandwith1) + ',' + str(NotchGain1) + ',' + str(NotchFrequency2) + ',' + str(NotchBandwith2) + ',' + str(NotchGain2) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerCorrectorNotchFiltersSet', PositionerName, NotchFrequency1, NotchBandwith1, NotchGain1, NotchFrequency2, NotchBandwith2, NotchGain2)
 
     # PositionerCorrectorNotchFiltersGet :  Read filters parameters
     def PositionerCorrectorNotchFiltersGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double', 'double', 'double', 'double')
         command = f'PositionerCorrectorNotchFiltersGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -758,15 +868,14 @@ class XPS:
     # PositionerCorrectorPIDFFAccelerationSet :  Update corrector parameters
     def PositionerCorrectorPIDFFAccelerationSet (self, socketId, PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime,
                                                  DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, FeedForwardGainAcceleration):
-        command = 'PositionerCorrectorPIDFFAccelerationSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + \
-                  str(KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(IntegrationTime) + ',' +\
-                  str(DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + \
-                  str(KForm) + ',' + str(FeedForwardGainAcceleration) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerCorrectorPIDFFAccelerationSet',
+                               PositionerName, ClosedLoopStatus, KP, KI, KD, KS,
+                               IntegrationTime, DerivativeFilterCutOffFrequency,
+                               GKP, GKI, GKD, KForm, FeedForwardGainAcceleration)
 
     # PositionerCorrectorPIDFFAccelerationGet :  Read corrector parameters
     def PositionerCorrectorPIDFFAccelerationGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')
         command = f'PositionerCorrectorPIDFFAccelerationGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -774,13 +883,12 @@ class XPS:
     # PositionerCorrectorPIDFFVelocitySet :  Update corrector parameters
     def PositionerCorrectorPIDFFVelocitySet (self, socketId, PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, FeedForwardGainVelocity):
 
-        command = 'PositionerCorrectorPIDFFVelocitySet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(IntegrationTime) + ',' + str(DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(KForm) + ',' + str(FeedForwardGainVelocity) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerCorrectorPIDFFVelocitySet', PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, FeedForwardGainVelocity)
 
 
     # PositionerCorrectorPIDFFVelocityGet :  Read corrector parameters
     def PositionerCorrectorPIDFFVelocityGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')
         command = f'PositionerCorrectorPIDFFVelocityGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -788,25 +896,23 @@ class XPS:
     # PositionerCorrectorPIDDualFFVoltageSet :  Update corrector parameters
     def PositionerCorrectorPIDDualFFVoltageSet (self, socketId, PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, FeedForwardGainVelocity, FeedForwardGainAcceleration, Friction):
 
-        command = 'PositionerCorrectorPIDDualFFVoltageSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(IntegrationTime) + ',' + str(DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(KForm) + ',' + str(FeedForwardGainVelocity) + ',' + str(FeedForwardGainAcceleration) + ',' + str(Friction) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerCorrectorPIDDualFFVoltageSet', PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, FeedForwardGainVelocity, FeedForwardGainAcceleration, Friction)
 
 
     # PositionerCorrectorPIDDualFFVoltageGet :  Read corrector parameters
     def PositionerCorrectorPIDDualFFVoltageGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('bool', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')
         command = f'PositionerCorrectorPIDDualFFVoltageGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerCorrectorPIPositionSet :  Update corrector parameters
     def PositionerCorrectorPIPositionSet (self, socketId, PositionerName, ClosedLoopStatus, KP, KI, IntegrationTime):
-        command = 'PositionerCorrectorPIPositionSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(IntegrationTime) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerCorrectorPIPositionSet', PositionerName, ClosedLoopStatus, KP, KI, IntegrationTime)
 
     # PositionerCorrectorPIPositionGet :  Read corrector parameters
     def PositionerCorrectorPIPositionGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('bool', 'double', 'double', 'double')
+        outputs = _outputs_cached('bool', 'double', 'double', 'double')
         command = f'PositionerCorrectorPIPositionGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -817,38 +923,36 @@ class XPS:
 
     # PositionerCurrentVelocityAccelerationFiltersGet :  Get current velocity and acceleration cutoff frequencies
     def PositionerCurrentVelocityAccelerationFiltersGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'PositionerCurrentVelocityAccelerationFiltersGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerCurrentVelocityAccelerationFiltersSet :  Set current velocity and acceleration cutoff frequencies
     def PositionerCurrentVelocityAccelerationFiltersSet (self, socketId, PositionerName, CurrentVelocityCutOffFrequency, CurrentAccelerationCutOffFrequency):
-        command = 'PositionerCurrentVelocityAccelerationFiltersSet(' + PositionerName + ',' + str(CurrentVelocityCutOffFrequency) + ',' + str(CurrentAccelerationCutOffFrequency) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerCurrentVelocityAccelerationFiltersSet', PositionerName, CurrentVelocityCutOffFrequency, CurrentAccelerationCutOffFrequency)
 
     # PositionerDriverFiltersGet :  Get driver filters parameters
     def PositionerDriverFiltersGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double', 'double', 'double')
         command = f'PositionerDriverFiltersGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerDriverFiltersSet :  Set driver filters parameters
     def PositionerDriverFiltersSet (self, socketId, PositionerName, KI, NotchFrequency, NotchBandwidth, NotchGain, LowpassFrequency):
-        command = 'PositionerDriverFiltersSet(' + PositionerName + ',' + str(KI) + ',' + str(NotchFrequency) + ',' + str(NotchBandwidth) + ',' + str(NotchGain) + ',' + str(LowpassFrequency) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerDriverFiltersSet', PositionerName, KI, NotchFrequency, NotchBandwidth, NotchGain, LowpassFrequency)
 
     # PositionerDriverPositionOffsetsGet :  Get driver stage and gage position offset
     def PositionerDriverPositionOffsetsGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'PositionerDriverPositionOffsetsGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerDriverStatusGet :  Read positioner driver status
     def PositionerDriverStatusGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('int')
+        outputs = _outputs_cached('int')
         command = f'PositionerDriverStatusGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -856,201 +960,193 @@ class XPS:
     # PositionerDriverStatusStringGet :  Return the positioner driver status string corresponding to the positioner error code
     def PositionerDriverStatusStringGet (self, socketId, PositionerDriverStatus):
         command = 'PositionerDriverStatusStringGet(' + str(PositionerDriverStatus) + ',char *)'
-        return self.Send(socketId, command)
+        return self._cached_string_get(socketId, ('PositionerDriverStatus', PositionerDriverStatus),
+                                       command)
 
     # PositionerEncoderAmplitudeValuesGet :  Read analog interpolated encoder amplitude values
     def PositionerEncoderAmplitudeValuesGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double', 'double')
         command = f'PositionerEncoderAmplitudeValuesGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerEncoderCalibrationParametersGet :  Read analog interpolated encoder calibration parameters
     def PositionerEncoderCalibrationParametersGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double', 'double')
         command = f'PositionerEncoderCalibrationParametersGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerErrorGet :  Read and clear positioner error code
     def PositionerErrorGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('int')
+        outputs = _outputs_cached('int')
         command = f'PositionerErrorGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerErrorRead :  Read only positioner error code without clear it
     def PositionerErrorRead (self, socketId, PositionerName):
-        outputs = XPSOutputs('int')
+        outputs = _outputs_cached('int')
         command = f'PositionerErrorRead({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerErrorStringGet :  Return the positioner status string corresponding to the positioner error code
     def PositionerErrorStringGet (self, socketId, PositionerErrorCode):
-        return self.Send(socketId, 'PositionerErrorStringGet(%s, char *)' % str(PositionerErrorCode))
+        return self._cached_string_get(socketId, ('PositionerError', PositionerErrorCode),
+                                       'PositionerErrorStringGet(%s, char *)' % str(PositionerErrorCode))
 
     # PositionerExcitationSignalGet :  Read disturbing signal parameters
     def PositionerExcitationSignalGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('int', 'double', 'double', 'double')
+        outputs = _outputs_cached('int', 'double', 'double', 'double')
         command = f'PositionerExcitationSignalGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerExcitationSignalSet :  Update disturbing signal parameters
     def PositionerExcitationSignalSet (self, socketId, PositionerName, Mode, Frequency, Amplitude, Time):
-        command = 'PositionerExcitationSignalSet(' + PositionerName + ',' + str(Mode) + ',' + str(Frequency) + ',' + str(Amplitude) + ',' + str(Time) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerExcitationSignalSet', PositionerName, Mode, Frequency, Amplitude, Time)
 
     # PositionerExternalLatchPositionGet :  Read external latch position
     def PositionerExternalLatchPositionGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double')
+        outputs = _outputs_cached('double')
         command = f'PositionerExternalLatchPositionGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerHardwareStatusGet :  Read positioner hardware status
     def PositionerHardwareStatusGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('int')
+        outputs = _outputs_cached('int')
         command = f'PositionerHardwareStatusGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerHardwareStatusStringGet :  Return the positioner hardware status string corresponding to the positioner error code
     def PositionerHardwareStatusStringGet (self, socketId, PositionerHardwareStatus):
-        return self.Send(socketId, 'PositionerHardwareStatusStringGet(%s, char *)' % str(PositionerHardwareStatus))
+        return self._cached_string_get(socketId, ('PositionerHardwareStatus', PositionerHardwareStatus),
+                                       'PositionerHardwareStatusStringGet(%s, char *)' % str(PositionerHardwareStatus))
 
     # PositionerHardInterpolatorFactorGet :  Get hard interpolator parameters
     def PositionerHardInterpolatorFactorGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('int')
+        outputs = _outputs_cached('int')
         command = f'PositionerHardInterpolatorFactorGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerHardInterpolatorFactorSet :  Set hard interpolator parameters
     def PositionerHardInterpolatorFactorSet (self, socketId, PositionerName, InterpolationFactor):
-        command = 'PositionerHardInterpolatorFactorSet(' + PositionerName + ',' + str(InterpolationFactor) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerHardInterpolatorFactorSet', PositionerName, InterpolationFactor)
 
     # PositionerMaximumVelocityAndAccelerationGet :  Return maximum velocity and acceleration of the positioner
     def PositionerMaximumVelocityAndAccelerationGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'PositionerMaximumVelocityAndAccelerationGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerMotionDoneGet :  Read motion done parameters
     def PositionerMotionDoneGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double', 'double', 'double')
         command = f'PositionerMotionDoneGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerMotionDoneSet :  Update motion done parameters
     def PositionerMotionDoneSet (self, socketId, PositionerName, PositionWindow, VelocityWindow, CheckingTime, MeanPeriod, TimeOut):
-        command = 'PositionerMotionDoneSet(' + PositionerName + ',' + str(PositionWindow) + ',' + str(VelocityWindow) + ',' + str(CheckingTime) + ',' + str(MeanPeriod) + ',' + str(TimeOut) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerMotionDoneSet', PositionerName, PositionWindow, VelocityWindow, CheckingTime, MeanPeriod, TimeOut)
 
     # PositionerPositionCompareAquadBAlwaysEnable :  Enable AquadB signal in always mode
     def PositionerPositionCompareAquadBAlwaysEnable (self, socketId, PositionerName):
-        command = 'PositionerPositionCompareAquadBAlwaysEnable(' + PositionerName + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerPositionCompareAquadBAlwaysEnable', PositionerName)
 
     # PositionerPositionCompareAquadBWindowedGet :  Read position compare AquadB windowed parameters
     def PositionerPositionCompareAquadBWindowedGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double', 'bool')
+        outputs = _outputs_cached('double', 'double', 'bool')
         command = f'PositionerPositionCompareAquadBWindowedGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerPositionCompareAquadBWindowedSet :  Set position compare AquadB windowed parameters
     def PositionerPositionCompareAquadBWindowedSet (self, socketId, PositionerName, MinimumPosition, MaximumPosition):
-        command = 'PositionerPositionCompareAquadBWindowedSet(' + PositionerName + ',' + str(MinimumPosition) + ',' + str(MaximumPosition) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerPositionCompareAquadBWindowedSet', PositionerName, MinimumPosition, MaximumPosition)
 
     # PositionerPositionCompareAquadBPrescalerSet: Sets PCO AquadB interpolation factor.
     def PositionerPositionCompareAquadBPrescalerSet(self, socketId, PositionerName, PCOInterpolationFactor):
-        command = 'PositionerPositionCompareAquadBPrescalerSet(' + PositionerName + ',' + str(
-            PCOInterpolationFactor) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerPositionCompareAquadBPrescalerSet',
+                               PositionerName, PCOInterpolationFactor)
 
     # PositionerPositionCompareAquadBPrescalerGet : Gets PCO AquadB interpolation factor.
     def PositionerPositionCompareAquadBPrescalerGet(self, socketId, PositionerName):
-        outputs = XPSOutputs('double')
+        outputs = _outputs_cached('double')
         command = f'PositionerPositionCompareAquadBPrescalerGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerPositionCompareGet :  Read position compare parameters
     def PositionerPositionCompareGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double', 'double', 'bool')
+        outputs = _outputs_cached('double', 'double', 'double', 'bool')
         command = f'PositionerPositionCompareGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerPositionCompareSet :  Set position compare parameters
     def PositionerPositionCompareSet (self, socketId, PositionerName, MinimumPosition, MaximumPosition, PositionStep):
-        command = 'PositionerPositionCompareSet(' + PositionerName + ',' + str(MinimumPosition) + ',' + str(MaximumPosition) + ',' + str(PositionStep) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerPositionCompareSet', PositionerName, MinimumPosition, MaximumPosition, PositionStep)
 
     # PositionerPositionCompareEnable :  Enable position compare
     def PositionerPositionCompareEnable (self, socketId, PositionerName):
-        command = 'PositionerPositionCompareEnable(' + PositionerName + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerPositionCompareEnable', PositionerName)
 
     # PositionerPositionCompareDisable :  Disable position compare
     def PositionerPositionCompareDisable (self, socketId, PositionerName):
-        command = 'PositionerPositionCompareDisable(' + PositionerName + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerPositionCompareDisable', PositionerName)
 
     # PositionerPositionComparePulseParametersGet :  Get position compare PCO pulse parameters
     def PositionerPositionComparePulseParametersGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'PositionerPositionComparePulseParametersGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerPositionComparePulseParametersSet :  Set position compare PCO pulse parameters
     def PositionerPositionComparePulseParametersSet (self, socketId, PositionerName, PCOPulseWidth, EncoderSettlingTime):
-        command = 'PositionerPositionComparePulseParametersSet(' + PositionerName + ',' + str(PCOPulseWidth) + ',' + str(EncoderSettlingTime) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerPositionComparePulseParametersSet', PositionerName, PCOPulseWidth, EncoderSettlingTime)
 
     # PositionerRawEncoderPositionGet :  Get the raw encoder position
     def PositionerRawEncoderPositionGet (self, socketId, PositionerName, UserEncoderPosition):
-        outputs = XPSOutputs('double')
+        outputs = _outputs_cached('double')
         command = f'PositionerRawEncoderPositionGet({PositionerName},{UserEncoderPosition},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionersEncoderIndexDifferenceGet :  Return the difference between index of primary axis and secondary axis (only after homesearch)
     def PositionersEncoderIndexDifferenceGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double')
+        outputs = _outputs_cached('double')
         command = f'PositionersEncoderIndexDifferenceGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerSGammaExactVelocityAjustedDisplacementGet :  Return adjusted displacement to get exact velocity
     def PositionerSGammaExactVelocityAjustedDisplacementGet (self, socketId, PositionerName, DesiredDisplacement):
-        outputs = XPSOutputs('double')
+        outputs = _outputs_cached('double')
         command = f'PositionerSGammaExactVelocityAjustedDisplacementGet({PositionerName},{DesiredDisplacement},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerSGammaParametersGet :  Read dynamic parameters for one axe of a group for a future displacement
     def PositionerSGammaParametersGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double', 'double')
         command = f'PositionerSGammaParametersGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerSGammaParametersSet :  Update dynamic parameters for one axe of a group for a future displacement
     def PositionerSGammaParametersSet (self, socketId, PositionerName, Velocity, Acceleration, MinimumTjerkTime, MaximumTjerkTime):
-        command = 'PositionerSGammaParametersSet(' + PositionerName + ',' + str(Velocity) + ',' + str(Acceleration) + ',' + str(MinimumTjerkTime) + ',' + str(MaximumTjerkTime) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerSGammaParametersSet', PositionerName, Velocity, Acceleration, MinimumTjerkTime, MaximumTjerkTime)
 
     # PositionerSGammaPreviousMotionTimesGet :  Read SettingTime and SettlingTime
     def PositionerSGammaPreviousMotionTimesGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'PositionerSGammaPreviousMotionTimesGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -1062,20 +1158,18 @@ class XPS:
 
     # PositionerStageParameterSet :  Save the stage parameter
     def PositionerStageParameterSet (self, socketId, PositionerName, ParameterName, ParameterValue):
-        command = 'PositionerStageParameterSet(' + PositionerName + ',' + ParameterName + ',' + ParameterValue + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerStageParameterSet', PositionerName, ParameterName, ParameterValue)
 
     # PositionerTimeFlasherGet :  Read time flasher parameters
     def PositionerTimeFlasherGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double', 'double', 'bool')
+        outputs = _outputs_cached('double', 'double', 'double', 'bool')
         command = f'PositionerTimeFlasherGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerTimeFlasherSet :  Set time flasher parameters
     def PositionerTimeFlasherSet (self, socketId, PositionerName, MinimumPosition, MaximumPosition, TimeInterval):
-        command = 'PositionerTimeFlasherSet(' + PositionerName + ',' + str(MinimumPosition) + ',' + str(MaximumPosition) + ',' + str(TimeInterval) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerTimeFlasherSet', PositionerName, MinimumPosition, MaximumPosition, TimeInterval)
 
     # PositionerTimeFlasherEnable :  Enable time flasher
     def PositionerTimeFlasherEnable (self, socketId, PositionerName):
@@ -1087,96 +1181,88 @@ class XPS:
 
     # PositionerUserTravelLimitsGet :  Read UserMinimumTarget and UserMaximumTarget
     def PositionerUserTravelLimitsGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'PositionerUserTravelLimitsGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerUserTravelLimitsSet :  Update UserMinimumTarget and UserMaximumTarget
     def PositionerUserTravelLimitsSet (self, socketId, PositionerName, UserMinimumTarget, UserMaximumTarget):
-        command = 'PositionerUserTravelLimitsSet(' + PositionerName + ',' + str(UserMinimumTarget) + ',' + str(UserMaximumTarget) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerUserTravelLimitsSet', PositionerName, UserMinimumTarget, UserMaximumTarget)
 
     # PositionerDACOffsetGet :  Get DAC offsets
     def PositionerDACOffsetGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('short', 'short')
+        outputs = _outputs_cached('short', 'short')
         command = f'PositionerDACOffsetGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerDACOffsetSet :  Set DAC offsets
     def PositionerDACOffsetSet (self, socketId, PositionerName, DACOffset1, DACOffset2):
-        command = 'PositionerDACOffsetSet(' + PositionerName + ',' + str(DACOffset1) + ',' + str(DACOffset2) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerDACOffsetSet', PositionerName, DACOffset1, DACOffset2)
 
     # PositionerDACOffsetDualGet :  Get dual DAC offsets
     def PositionerDACOffsetDualGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('short', 'short', 'short', 'short')
+        outputs = _outputs_cached('short', 'short', 'short', 'short')
         command = f'PositionerDACOffsetDualGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerDACOffsetDualSet :  Set dual DAC offsets
     def PositionerDACOffsetDualSet (self, socketId, PositionerName, PrimaryDACOffset1, PrimaryDACOffset2, SecondaryDACOffset1, SecondaryDACOffset2):
-        command = 'PositionerDACOffsetDualSet(' + PositionerName + ',' + str(PrimaryDACOffset1) + ',' + str(PrimaryDACOffset2) + ',' + str(SecondaryDACOffset1) + ',' + str(SecondaryDACOffset2) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'PositionerDACOffsetDualSet', PositionerName, PrimaryDACOffset1, PrimaryDACOffset2, SecondaryDACOffset1, SecondaryDACOffset2)
 
     # PositionerCorrectorAutoTuning :  Astrom&Hagglund based auto-tuning
     def PositionerCorrectorAutoTuning (self, socketId, PositionerName, TuningMode):
-        outputs = XPSOutputs('double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double')
         command = f'PositionerCorrectorAutoTuning({PositionerName},{TuningMode},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # PositionerAccelerationAutoScaling :  Astrom&Hagglund based auto-scaling
     def PositionerAccelerationAutoScaling (self, socketId, PositionerName):
-        outputs = XPSOutputs('double')
+        outputs = _outputs_cached('double')
         command = f'PositionerAccelerationAutoScaling({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # MultipleAxesPVTVerification :  Multiple axes PVT trajectory verification
     def MultipleAxesPVTVerification (self, socketId, GroupName, TrajectoryFileName):
-        command = 'MultipleAxesPVTVerification(' + GroupName + ',' + TrajectoryFileName + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'MultipleAxesPVTVerification', GroupName, TrajectoryFileName)
     
     # MultipleAxesPTVerification :  Multiple axes PT trajectory verification
     def MultipleAxesPTVerification (self, socketId, GroupName, TrajectoryFileName):
-        command = 'MultipleAxesPTVerification(' + GroupName + ',' + TrajectoryFileName + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'MultipleAxesPTVerification', GroupName, TrajectoryFileName)
 
     # MultipleAxesPVTVerificationResultGet :  Multiple axes PVT trajectory verification result get
     def MultipleAxesPVTVerificationResultGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('char', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('char', 'double', 'double', 'double', 'double')
         command = f'MultipleAxesPVTVerificationResultGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # MultipleAxesPVTExecution :  Multiple axes PVT trajectory execution
     def MultipleAxesPVTExecution (self, socketId, GroupName, TrajectoryFileName, ExecutionNumber):
-        command = 'MultipleAxesPVTExecution(' + GroupName + ',' + TrajectoryFileName + ',' + str(ExecutionNumber) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'MultipleAxesPVTExecution', GroupName, TrajectoryFileName, ExecutionNumber)
     
     # MultipleAxesPTExecution :  Multiple axes PT trajectory execution
     def MultipleAxesPTExecution (self, socketId, GroupName, TrajectoryFileName, ExecutionNumber):
-        command = 'MultipleAxesPTExecution(' + GroupName + ',' + TrajectoryFileName + ',' + str(ExecutionNumber) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'MultipleAxesPTExecution', GroupName, TrajectoryFileName, ExecutionNumber)
 
     # MultipleAxesPVTParametersGet :  Multiple axes PVT trajectory get parameters
     def MultipleAxesPVTParametersGet (self, socketId, GroupName):
-        outputs = XPSOutputs('char', 'int')
+        outputs = _outputs_cached('char', 'int')
         command = f'MultipleAxesPVTParametersGet({GroupName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # MultipleAxesPVTPulseOutputSet :  Configure pulse output on trajectory
     def MultipleAxesPVTPulseOutputSet (self, socketId, GroupName, StartElement, EndElement, TimeInterval):
-        command = 'MultipleAxesPVTPulseOutputSet(' + GroupName + ',' + str(StartElement) + ',' + str(EndElement) + ',' + str(TimeInterval) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'MultipleAxesPVTPulseOutputSet', GroupName, StartElement, EndElement, TimeInterval)
 
     # MultipleAxesPVTPulseOutputGet :  Get pulse output on trajectory configuration
     def MultipleAxesPVTPulseOutputGet (self, socketId, GroupName):
-        outputs = XPSOutputs('int', 'int', 'double')
+        outputs = _outputs_cached('int', 'int', 'double')
         command = f'MultipleAxesPVTPulseOutputGet({GroupName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -1191,12 +1277,11 @@ class XPS:
 
     # SingleAxisSlaveParametersSet :  Set slave parameters
     def SingleAxisSlaveParametersSet (self, socketId, GroupName, PositionerName, Ratio):
-        command = 'SingleAxisSlaveParametersSet(' + GroupName + ',' + PositionerName + ',' + str(Ratio) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'SingleAxisSlaveParametersSet', GroupName, PositionerName, Ratio)
 
     # SingleAxisSlaveParametersGet :  Get slave parameters
     def SingleAxisSlaveParametersGet (self, socketId, GroupName):
-        outputs = XPSOutputs('char', 'double')
+        outputs = _outputs_cached('char', 'double')
         command = f'SingleAxisSlaveParametersGet({GroupName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -1211,103 +1296,95 @@ class XPS:
 
     # SpindleSlaveParametersSet :  Set slave parameters
     def SpindleSlaveParametersSet (self, socketId, GroupName, PositionerName, Ratio):
-        command = 'SpindleSlaveParametersSet(' + GroupName + ',' + PositionerName + ',' + str(Ratio) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'SpindleSlaveParametersSet', GroupName, PositionerName, Ratio)
 
     # SpindleSlaveParametersGet :  Get slave parameters
     def SpindleSlaveParametersGet (self, socketId, GroupName):
-        outputs = XPSOutputs('char', 'double')
+        outputs = _outputs_cached('char', 'double')
         command = f'SpindleSlaveParametersGet({GroupName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # GroupSpinParametersSet :  Modify Spin parameters on selected group and activate the continuous move
     def GroupSpinParametersSet (self, socketId, GroupName, Velocity, Acceleration):
-        command = 'GroupSpinParametersSet(' + GroupName + ',' + str(Velocity) + ',' + str(Acceleration) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'GroupSpinParametersSet', GroupName, Velocity, Acceleration)
 
     # GroupSpinParametersGet :  Get Spin parameters on selected group
     def GroupSpinParametersGet (self, socketId, GroupName):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'GroupSpinParametersGet({GroupName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # GroupSpinCurrentGet :  Get Spin current on selected group
     def GroupSpinCurrentGet (self, socketId, GroupName):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'GroupSpinCurrentGet({GroupName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # GroupSpinModeStop :  Stop Spin mode on selected group with specified acceleration
     def GroupSpinModeStop (self, socketId, GroupName, Acceleration):
-        command = 'GroupSpinModeStop(' + GroupName + ',' + str(Acceleration) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'GroupSpinModeStop', GroupName, Acceleration)
 
     # XYLineArcVerification :  XY trajectory verification
     def XYLineArcVerification (self, socketId, GroupName, TrajectoryFileName):
-        command = 'XYLineArcVerification(' + GroupName + ',' + TrajectoryFileName + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'XYLineArcVerification', GroupName, TrajectoryFileName)
 
     # XYLineArcVerificationResultGet :  XY trajectory verification result get
     def XYLineArcVerificationResultGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('char', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('char', 'double', 'double', 'double', 'double')
         command = f'XYLineArcVerificationResultGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # XYLineArcExecution :  XY trajectory execution
     def XYLineArcExecution (self, socketId, GroupName, TrajectoryFileName, Velocity, Acceleration, ExecutionNumber):
-        command = 'XYLineArcExecution(' + GroupName + ',' + TrajectoryFileName + ',' + str(Velocity) + ',' + str(Acceleration) + ',' + str(ExecutionNumber) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'XYLineArcExecution', GroupName, TrajectoryFileName, Velocity, Acceleration, ExecutionNumber)
 
     # XYLineArcParametersGet :  XY trajectory get parameters
     def XYLineArcParametersGet (self, socketId, GroupName):
-        outputs = XPSOutputs('char', 'double', 'double', 'int')
+        outputs = _outputs_cached('char', 'double', 'double', 'int')
         command = f'XYLineArcParametersGet({GroupName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # XYLineArcPulseOutputSet :  Configure pulse output on trajectory
     def XYLineArcPulseOutputSet (self, socketId, GroupName, StartLength, EndLength, PathLengthInterval):
-        command = 'XYLineArcPulseOutputSet(' + GroupName + ',' + str(StartLength) + ',' + str(EndLength) + ',' + str(PathLengthInterval) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'XYLineArcPulseOutputSet', GroupName, StartLength, EndLength, PathLengthInterval)
 
     # XYLineArcPulseOutputGet :  Get pulse output on trajectory configuration
     def XYLineArcPulseOutputGet (self, socketId, GroupName):
-        outputs = XPSOutputs('double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double')
         command = f'XYLineArcPulseOutputGet({GroupName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # XYZGroupPositionCorrectedProfilerGet :  Return corrected profiler positions
     def XYZGroupPositionCorrectedProfilerGet (self, socketId, GroupName, PositionX, PositionY, PositionZ):
-        outputs = XPSOutputs('double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double')
         command = f'XYZGroupPositionCorrectedProfilerGet({GroupName},{PositionX},{PositionY},{PositionZ},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # XYZSplineVerification :  XYZ trajectory verifivation
     def XYZSplineVerification (self, socketId, GroupName, TrajectoryFileName):
-        command = 'XYZSplineVerification(' + GroupName + ',' + TrajectoryFileName + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'XYZSplineVerification', GroupName, TrajectoryFileName)
 
     # XYZSplineVerificationResultGet :  XYZ trajectory verification result get
     def XYZSplineVerificationResultGet (self, socketId, PositionerName):
-        outputs = XPSOutputs('char', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('char', 'double', 'double', 'double', 'double')
         command = f'XYZSplineVerificationResultGet({PositionerName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # XYZSplineExecution :  XYZ trajectory execution
     def XYZSplineExecution (self, socketId, GroupName, TrajectoryFileName, Velocity, Acceleration):
-        command = 'XYZSplineExecution(' + GroupName + ',' + TrajectoryFileName + ',' + str(Velocity) + ',' + str(Acceleration) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'XYZSplineExecution', GroupName, TrajectoryFileName, Velocity, Acceleration)
 
     # XYZSplineParametersGet :  XYZ trajectory get parameters
     def XYZSplineParametersGet (self, socketId, GroupName):
-        outputs = XPSOutputs('char', 'double', 'double', 'int')
+        outputs = _outputs_cached('char', 'double', 'double', 'int')
         command = f'XYZSplineParametersGet({GroupName},{outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
@@ -1326,8 +1403,7 @@ class XPS:
 
     # EEPROMDACOffsetCIESet :  Set CIE DAC offsets
     def EEPROMDACOffsetCIESet (self, socketId, PlugNumber, DAC1Offset, DAC2Offset):
-        command = 'EEPROMDACOffsetCIESet(' + str(PlugNumber) + ',' + str(DAC1Offset) + ',' + str(DAC2Offset) + ')'
-        return self.Send(socketId, command)
+        return self._send_args(socketId, 'EEPROMDACOffsetCIESet', PlugNumber, DAC1Offset, DAC2Offset)
 
     # EEPROMDriverSet :  Set Driver EEPROM reference string
     def EEPROMDriverSet (self, socketId, PlugNumber, ReferenceString):
@@ -1339,107 +1415,134 @@ class XPS:
 
     # CPUCoreAndBoardSupplyVoltagesGet :  Get power informations
     def CPUCoreAndBoardSupplyVoltagesGet (self, socketId):
-        outputs = XPSOutputs('double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')
         command = f'CPUCoreAndBoardSupplyVoltagesGet({outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # CPUTemperatureAndFanSpeedGet :  Get CPU temperature and fan speed
     def CPUTemperatureAndFanSpeedGet (self, socketId):
-        outputs = XPSOutputs('double', 'double')
+        outputs = _outputs_cached('double', 'double')
         command = f'CPUTemperatureAndFanSpeedGet({outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # ActionListGet :  Action list
     def ActionListGet (self, socketId):
-        return self.Send(socketId, 'ActionListGet(char *)')
+        return self._cached_string_get(socketId, 'ActionListGet',
+                                       'ActionListGet(char *)')
 
     # ActionExtendedListGet :  Action extended list
     def ActionExtendedListGet (self, socketId):
-        return self.Send(socketId, 'ActionExtendedListGet(char *)')
+        return self._cached_string_get(socketId, 'ActionExtendedListGet',
+                                       'ActionExtendedListGet(char *)')
 
     # APIExtendedListGet :  API method list
     def APIExtendedListGet (self, socketId):
-        return self.Send(socketId, 'APIExtendedListGet(char *)')
+        return self._cached_string_get(socketId, 'APIExtendedListGet',
+                                       'APIExtendedListGet(char *)')
 
     # APIListGet :  API method list without extended API
     def APIListGet (self, socketId):
-        return self.Send(socketId, 'APIListGet(char *)')
+        return self._cached_string_get(socketId, 'APIListGet',
+                                       'APIListGet(char *)')
 
     # ControllerStatusListGet :  Controller status list
     def ControllerStatusListGet (self, socketId):
-        return self.Send(socketId, 'ControllerStatusListGet(char *)')
+        return self._cached_string_get(socketId, 'ControllerStatusListGet',
+                                       'ControllerStatusListGet(char *)')
 
     # ErrorListGet :  Error list
     def ErrorListGet (self, socketId):
-        return self.Send(socketId, 'ErrorListGet(char *)')
+        return self._cached_string_get(socketId, 'ErrorListGet',
+                                       'ErrorListGet(char *)')
 
     # EventListGet :  General event list
     def EventListGet (self, socketId):
-        return self.Send(socketId, 'EventListGet(char *)')
+        return self._cached_string_get(socketId, 'EventListGet',
+                                       'EventListGet(char *)')
 
     # GatheringListGet :  Gathering type list
     def GatheringListGet (self, socketId):
-        return self.Send(socketId,'GatheringListGet(char *)')
+        return self._cached_string_get(socketId, 'GatheringListGet',
+                                       'GatheringListGet(char *)')
 
     # GatheringExtendedListGet :  Gathering type extended list
     def GatheringExtendedListGet (self, socketId):
-        return self.Send(socketId, 'GatheringExtendedListGet(char *)')
+        return self._cached_string_get(socketId, 'GatheringExtendedListGet',
+                                       'GatheringExtendedListGet(char *)')
 
     # GatheringExternalListGet :  External Gathering type list
     def GatheringExternalListGet (self, socketId):
-        return self.Send(socketId, 'GatheringExternalListGet(char *)')
+        return self._cached_string_get(socketId, 'GatheringExternalListGet',
+                                       'GatheringExternalListGet(char *)')
 
     # GroupStatusListGet :  Group status list
     def GroupStatusListGet (self, socketId):
-        return self.Send(socketId, 'GroupStatusListGet(char *)')
+        return self._cached_string_get(socketId, 'GroupStatusListGet',
+                                       'GroupStatusListGet(char *)')
 
     # HardwareInternalListGet :  Internal hardware list
     def HardwareInternalListGet (self, socketId):
-        return self.Send(socketId, 'HardwareInternalListGet(char *)')
+        return self._cached_string_get(socketId, 'HardwareInternalListGet',
+                                       'HardwareInternalListGet(char *)')
 
     # HardwareDriverAndStageGet :  Smart hardware
     def HardwareDriverAndStageGet (self, socketId, PlugNumber):
-        outputs = XPSOutputs('char', 'char')
+        # hardware identity per plug is fixed until a reboot, so cache
+        # it alongside the other session-static lookups
+        key = ('HardwareDriverAndStage', PlugNumber)
+        hit = self._string_cache.get(key)
+        if hit is not None:
+            return hit
+        outputs = _outputs_cached('char', 'char')
         command = f'HardwareDriverAndStageGet({PlugNumber},{outputs})'
         error, returnedString = self.Send(socketId, command)
-        return outputs.parse(error, returnedString)
+        ret = outputs.parse(error, returnedString)
+        if error == 0:
+            self._string_cache[key] = ret
+        return ret
 
     # ObjectsListGet :  Group name and positioner name
     def ObjectsListGet (self, socketId):
-        return self.Send(socketId, 'ObjectsListGet(char *)')
+        return self._cached_string_get(socketId, 'ObjectsListGet',
+                                       'ObjectsListGet(char *)')
 
     # PositionerErrorListGet :  Positioner error list
     def PositionerErrorListGet (self, socketId):
-        return self.Send(socketId, 'PositionerErrorListGet(char *)')
+        return self._cached_string_get(socketId, 'PositionerErrorListGet',
+                                       'PositionerErrorListGet(char *)')
 
     # PositionerHardwareStatusListGet :  Positioner hardware status list
     def PositionerHardwareStatusListGet (self, socketId):
-        return self.Send(socketId, 'PositionerHardwareStatusListGet(char *)')
+        return self._cached_string_get(socketId, 'PositionerHardwareStatusListGet',
+                                       'PositionerHardwareStatusListGet(char *)')
 
     # PositionerDriverStatusListGet :  Positioner driver status list
     def PositionerDriverStatusListGet (self, socketId):
-        return self.Send(socketId, 'PositionerDriverStatusListGet(char *)')
+        return self._cached_string_get(socketId, 'PositionerDriverStatusListGet',
+                                       'PositionerDriverStatusListGet(char *)')
 
     # ReferencingActionListGet :  Get referencing action list
     def ReferencingActionListGet (self, socketId):
-        return self.Send(socketId, 'ReferencingActionListGet(char *)')
+        return self._cached_string_get(socketId, 'ReferencingActionListGet',
+                                       'ReferencingActionListGet(char *)')
 
     # ReferencingSensorListGet :  Get referencing sensor list
     def ReferencingSensorListGet (self, socketId):
-        return self.Send(socketId, 'ReferencingSensorListGet(char *)')
+        return self._cached_string_get(socketId, 'ReferencingSensorListGet',
+                                       'ReferencingSensorListGet(char *)')
 
     # GatheringUserDatasGet :  Return user data values
     def GatheringUserDatasGet (self, socketId):
-        outputs = XPSOutputs('double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double', 'double', 'double', 'double', 'double', 'double')
         command = f'GatheringUserDatasGet({outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
 
     # ControllerMotionKernelPeriodMinMaxGet :  Get controller motion kernel min/max periods
     def ControllerMotionKernelPeriodMinMaxGet (self, socketId):
-        outputs = XPSOutputs('double', 'double', 'double', 'double', 'double', 'double')
+        outputs = _outputs_cached('double', 'double', 'double', 'double', 'double', 'double')
         command = f'ControllerMotionKernelPeriodMinMaxGet({outputs})'
         error, returnedString = self.Send(socketId, command)
         return outputs.parse(error, returnedString)
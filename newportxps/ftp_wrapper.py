@@ -1,12 +1,22 @@
 #!/usr/bin/env python
 
+import os
 import ftplib
+import socket
 from io import BytesIO
 from .utils import str2bytes, bytes2str, ENCODING
 
+# transfer chunk size: ftplib's 8 KB default means many recv syscalls
+# for the multi-MB gathering files
+FTP_BLOCKSIZE = 131072
+
 import logging
+# quiet the whole paramiko tree: the ERROR level is inherited by its
+# child loggers, so per-packet DEBUG records are never constructed,
+# and the NullHandler keeps logging's last-resort stderr output away
 logger = logging.getLogger('paramiko')
 logger.setLevel(logging.ERROR)
+logger.addHandler(logging.NullHandler())
 
 
 HAS_PYSFTP = False
@@ -25,15 +35,37 @@ class FTPBaseWrapper(object):
         self.username = username
         self.password = password
         self._conn = None
+        self._conn_args = None
 
     def close(self):
         if self._conn is not None:
             self._conn.close()
         self._conn = None
+        self._conn_args = None
 
     def cwd(self, remotedir):
         self._conn.cwd(remotedir)
 
+    def _ping(self):
+        "cheap liveness check of the current connection"
+        raise NotImplementedError
+
+    def reuse_connection(self):
+        """reuse the open connection when it is still alive and was made
+        with the current credentials, skipping the handshake and
+        re-login.  Note that a reused connection keeps its working
+        directory, so follow connect() with cwd() as usual."""
+        if (self._conn is None or
+            self._conn_args != (self.host, self.username, self.password)):
+            return False
+        try:
+            self._ping()
+            return True
+        except Exception:
+            self._conn = None
+            self._conn_args = None
+            return False
+
     def connect(self, host=None, username=None, password=None):
         raise NotImplementedError
 
@@ -41,6 +73,12 @@ class FTPBaseWrapper(object):
         "save remote file to local file"
         raise NotImplementedError
 
+    def save_many(self, remotefiles, localdir='.'):
+        """save several remote files from the current directory over
+        the one open connection, avoiding a reconnect per file"""
+        for rfile in remotefiles:
+            self.save(rfile, os.path.join(localdir, rfile))
+
     def getlines(self, remotefile):
         "read text of remote file"
         raise NotImplementedError
@@ -67,16 +105,31 @@ class SFTPWrapper(FTPBaseWrapper):
 
         if not HAS_PYSFTP:
             raise ValueError("pysftp not installed.")
+        if self.reuse_connection():
+            return
         try:
             self._conn = pysftp.Connection(self.host,
                                            username=self.username,
                                            password=self.password)
-        except:
+            self._conn_args = (self.host, self.username, self.password)
+            # short config puts should not wait out Nagle, and the ssh
+            # keepalive spots a dropped link between transfers
+            transport = self._conn.sftp_client.get_channel().get_transport()
+            transport.set_keepalive(30)
+            transport.sock.setsockopt(socket.IPPROTO_TCP,
+                                      socket.TCP_NODELAY, 1)
+        except Exception:
             print("ERROR: sftp connection to %s failed" % self.host)
             print("You may need to add the host keys for your XPS to your")
             print("ssh known_hosts file, using a command like this:")
             print("  ssh-keyscan %s >> ~/.ssh/known_hosts" % self.host)
+            # re-raise so the caller sees the real failure instead of
+            # an AttributeError from the first use of self._conn
+            raise
+
 
+    def _ping(self):
+        self._conn.stat('.')
 
     def save(self, remotefile, localfile):
         "save remote file to local file"
@@ -86,13 +139,45 @@ class SFTPWrapper(FTPBaseWrapper):
         "read text of remote file"
         tmp = BytesIO()
         self._conn.getfo(remotefile, tmp)
-        tmp.seek(0)
-        text = bytes2str(tmp.read())
-        return text.split('\n')
+        return bytes2str(tmp.getvalue()).splitlines()
 
     def put(self, text, remotefile):
-        txtfile = BytesIO(str2bytes(text))
-        self._conn.putfo(txtfile, remotefile)
+        # write the encoded bytes directly: skips the BytesIO copy,
+        # and pipelined mode streams the WRITEs instead of waiting for
+        # a server ack per chunk
+        data = str2bytes(text)
+        with self._conn.open(remotefile, 'wb') as fout:
+            fout.set_pipelined(True)
+            fout.write(data)
+
+    def save_concurrent(self, remotefiles, localdir='.', nworkers=4):
+        """download several files from the current remote directory in
+        parallel: ssh multiplexes channels cheaply, so each worker gets
+        its own sftp channel on the one authenticated transport"""
+        from concurrent.futures import ThreadPoolExecutor
+        from paramiko import SFTPClient
+        transport = self._conn.sftp_client.get_channel().get_transport()
+        remotedir = self._conn.pwd
+        def fetch(rfile):
+            chan = SFTPClient.from_transport(transport)
+            try:
+                chan.get('%s/%s' % (remotedir, rfile),
+                         os.path.join(localdir, rfile))
+            finally:
+                chan.close()
+        with ThreadPoolExecutor(max_workers=nworkers) as pool:
+            list(pool.map(fetch, remotefiles))
+
+
+class XPSFTP(ftplib.FTP):
+    """ftplib.FTP tuned for bulk transfers from the XPS: TCP_NODELAY
+    and 1 MB buffers on every data socket"""
+    def ntransfercmd(self, cmd, rest=None):
+        conn, size = ftplib.FTP.ntransfercmd(self, cmd, rest)
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1048576)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1048576)
+        return conn, size
 
 
 class FTPWrapper(FTPBaseWrapper):
@@ -110,9 +195,16 @@ class FTPWrapper(FTPBaseWrapper):
         if password is not None:
             self.password = password
 
-        self._conn = ftplib.FTP()
+        if self.reuse_connection():
+            return
+        self._conn = XPSFTP()
         self._conn.connect(self.host)
+        self._conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self._conn.login(self.username, self.password)
+        self._conn_args = (self.host, self.username, self.password)
+
+    def _ping(self):
+        self._conn.voidcmd('NOOP')
 
     def list(self):
         "list files in a given directory (default the current)"
@@ -120,21 +212,26 @@ class FTPWrapper(FTPBaseWrapper):
 
     def save(self, remotefile, localfile):
         "save remote file to local file"
-        output = []
-        self._conn.retrbinary(f'RETR {remotefile}', output.append)
-        with open(localfile, 'w', encoding=ENCODING) as fout:
-            fout.write(''.join([bytes2str(s) for s in output]))
+        # stream each chunk straight to disk: no list of chunks, no
+        # join, and peak memory stays at one socket buffer instead of
+        # twice the file size
+        with open(localfile, 'wb') as fout:
+            self._conn.retrbinary(f'RETR {remotefile}', fout.write,
+                                  blocksize=FTP_BLOCKSIZE)
 
     def getlines(self, remotefile):
         "read text of remote file"
-        output = []
-        self._conn.retrbinary('RETR %s' % remotefile, output.append)
-        text = ''.join([bytes2str(line) for line in output])
-        return text.split('\n')
+        buff = BytesIO()
+        self._conn.retrbinary('RETR %s' % remotefile, buff.write,
+                              blocksize=FTP_BLOCKSIZE)
+        # one decode and one splitlines() pass, which also absorbs the
+        # controller's dos-style line endings
+        return bytes2str(buff.getvalue()).splitlines()
 
     def put(self, text, remotefile):
         txtfile = BytesIO(str2bytes(text))
-        self._conn.storbinary('STOR %s' % remotefile, txtfile)
+        self._conn.storbinary('STOR %s' % remotefile, txtfile,
+                              blocksize=FTP_BLOCKSIZE)
 
     def delete(self, remotefile):
         "delete remote file"
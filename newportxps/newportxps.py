@@ -1,11 +1,14 @@
  #!/usr/bin/env python
 
+import hashlib
 import posixpath
+import re
 import sys
 import time
 import socket
+from contextlib import contextmanager
 from copy import deepcopy
-from configparser import  ConfigParser
+from io import StringIO
 import numpy as np
 
 from .debugtime import debugtime
@@ -16,6 +19,39 @@ from .ftp_wrapper import SFTPWrapper, FTPWrapper
 IDLE, ARMING, ARMED, RUNNING, COMPLETE, WRITING, READING = \
       'IDLE', 'ARMING', 'ARMED', 'RUNNING', 'COMPLETE', 'WRITING', 'READING'
 
+_SECTION_RE = re.compile(r'^\s*\[([^\]]+)\]\s*$')
+_KEYVAL_RE = re.compile(r'^\s*([^=;#\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+class FastConfigParser:
+    """minimal ini parser for the controller's system.ini: sections of
+    plain key = value pairs, no interpolation, defaults or multi-line
+    values, which is all these files contain.  ConfigParser does far
+    more per line than connect() needs.  option names are lowercased,
+    as ConfigParser did"""
+    def __init__(self, text):
+        self.data = {}
+        section = None
+        for line in text.split('\n'):
+            m = _SECTION_RE.match(line)
+            if m is not None:
+                section = self.data.setdefault(m.group(1).strip(), {})
+                continue
+            m = _KEYVAL_RE.match(line)
+            if m is not None and section is not None:
+                section[m.group(1).strip().lower()] = m.group(2)
+
+    def sections(self):
+        return list(self.data)
+
+    def items(self, section):
+        return list(self.data[section].items())
+
+    def options(self, section):
+        return list(self.data[section])
+
+    def get(self, section, key):
+        return self.data[section][key.lower()]
+
 def withConnectedXPS(fcn):
     """decorator to ensure a NewportXPS is connected before a method is called"""
     def wrapper(self, *args, **kwargs):
@@ -31,6 +67,11 @@ def withConnectedXPS(fcn):
 
 class NewportXPS:
     gather_header = '# XPS Gathering Data\n#--------------'
+
+    # parsed system.ini results, shared across instances and keyed by
+    # content fingerprint: reconnects to an unchanged controller skip
+    # the re-parse and the per-stage limit queries
+    _systemini_cache = {}
     def __init__(self, host, group=None,
                  username='Administrator', password='Administrator',
                  port=5001, timeout=10, extra_triggers=0,
@@ -121,6 +162,16 @@ class NewportXPS:
         self.read_systemini()
 
 
+    @contextmanager
+    def _ftp_session(self, *subdirs):
+        """connect to the controller's ftp server -- reusing the live
+        session when there is one -- and cd to ftphome/subdirs.  the
+        connection is left open for the next transfer, and torn down in
+        reboot() or when the wrapper's liveness probe fails"""
+        self.ftpconn.connect(**self.ftpargs)
+        self.ftpconn.cwd(posixpath.join(self.ftphome, *subdirs))
+        yield self.ftpconn
+
     def check_error(self, err, msg='', with_raise=True):
         if err != 0:
             err = f"{err}"
@@ -135,10 +186,8 @@ class NewportXPS:
         Parameters:
         fname  (string): name of file to save to ['system.ini']
         """
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Config'))
-        self.ftpconn.save('system.ini', fname)
-        self.ftpconn.close()
+        with self._ftp_session('Config') as conn:
+            conn.save('system.ini', fname)
 
     def save_stagesini(self, fname='stages.ini'):
         """save stages.ini to disk
@@ -146,26 +195,32 @@ class NewportXPS:
         Parameters:
            fname  (string): name of file to save to ['stages.ini']
         """
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Config'))
-        self.ftpconn.save('stages.ini', fname)
-        self.ftpconn.close()
+        with self._ftp_session('Config') as conn:
+            conn.save('stages.ini', fname)
 
     def read_systemini(self):
         """read group info from system.ini
         this is part of the connection process
         """
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Config'))
-        lines = self.ftpconn.getlines('system.ini')
-        self.ftpconn.close()
+        with self._ftp_session('Config') as conn:
+            lines = conn.getlines('system.ini')
         initext = '\n'.join([line.strip() for line in lines])
 
+        # unchanged file -> same groups/stages, including the limits
+        # read from the controller below
+        cache_key = (self.host, self.ftphome,
+                     hashlib.blake2b(initext.encode(), digest_size=16).digest())
+        cached = NewportXPS._systemini_cache.get(cache_key)
+        if cached is not None:
+            self.groups, self.stages, pvtgroups = deepcopy(cached)
+            if len(pvtgroups) == 1:
+                self.set_trajectory_group(pvtgroups[0])
+            return self.groups
+
         pvtgroups = []
         self.stages= {}
         self.groups = {}
-        sconf = ConfigParser()
-        sconf.read_string(initext)
+        sconf = FastConfigParser(initext)
 
         # read and populate lists of groups first
         for gtype, glist in sconf.items('GROUPS'):
@@ -186,26 +241,44 @@ class NewportXPS:
                 poslist = sconf.get(section, 'positionerinuse')
                 posnames = [a.strip() for a in poslist.split(',')]
                 self.groups[section]['positioners'] = posnames
+                # lowered once here: move_group matches keyword names
+                # case-insensitively on every call
+                self.groups[section]['_positioners_lc'] = tuple(p.lower() for p in posnames)
             elif 'plugnumber' in items: # this is a stage
                 self.stages[section] = {'stagetype': sconf.get(section, 'stagename')}
 
         if len(pvtgroups) == 1:
             self.set_trajectory_group(pvtgroups[0])
 
+        # pipeline the two limit queries per stage in one batched
+        # round-trip instead of 2*nstages
+        cmds = []
         for sname in self.stages:
-            ret = self._xps.PositionerMaximumVelocityAndAccelerationGet(self._sid, sname)
-            try:
-                self.stages[sname]['max_velo']  = ret[1]
-                self.stages[sname]['max_accel'] = ret[2]/3.0
-            except:
+            cmds.append(f'PositionerMaximumVelocityAndAccelerationGet({sname},double *,double *)')
+            cmds.append(f'PositionerUserTravelLimitsGet({sname},double *,double *)')
+        replies = self._xps.Send_batch(self._sid, cmds)
+        for sname, (verr, vmsg), (lerr, lmsg) in zip(self.stages,
+                                                     replies[0::2],
+                                                     replies[1::2]):
+            # test the error code instead of catching the IndexError
+            # from a failed reply: uninitialized axes error routinely,
+            # and raising/unwinding per stage is the slow path
+            if verr == 0:
+                maxvelo, maxaccel = (float(x) for x in vmsg.split(','))
+                self.stages[sname]['max_velo']  = maxvelo
+                self.stages[sname]['max_accel'] = maxaccel/3.0
+            else:
                 print(f"could not read max velo/accel for {sname}")
-            ret = self._xps.PositionerUserTravelLimitsGet(self._sid, sname)
-            try:
-                self.stages[sname]['low_limit']  = ret[1]
-                self.stages[sname]['high_limit'] = ret[2]
-            except:
+            if lerr == 0:
+                low_limit, high_limit = (float(x) for x in lmsg.split(','))
+                self.stages[sname]['low_limit']  = low_limit
+                self.stages[sname]['high_limit'] = high_limit
+            else:
                 print(f"could not read limits for {sname}")
 
+        NewportXPS._systemini_cache[cache_key] = deepcopy((self.groups,
+                                                           self.stages,
+                                                           pvtgroups))
         return self.groups
 
     def download_trajectory(self, filename):
@@ -216,10 +289,8 @@ class NewportXPS:
            filename (str):  name of trajectory file
            text  (str):   full text of trajectory file
         """
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Public', 'Trajectories'))
-        self.ftpconn.save(filename, filename)
-        self.ftpconn.close()
+        with self._ftp_session('Public', 'Trajectories') as conn:
+            conn.save(filename, filename)
 
     def upload_trajectory(self, filename,  text):
         """upload text of trajectory file
@@ -229,19 +300,15 @@ class NewportXPS:
            filename (str):  name of trajectory file
            text  (str):   full text of trajectory file
         """
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Public', 'Trajectories'))
-        self.ftpconn.put(clean_text(text), filename)
-        self.ftpconn.close()
+        with self._ftp_session('Public', 'Trajectories') as conn:
+            conn.put(clean_text(text), filename)
 
     def list_scripts(self):
         """list all existent scripts files
         """
         remotefiles = ""
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Public', 'Scripts'))
-        remotefiles = self.ftpconn.list()
-        self.ftpconn.close()
+        with self._ftp_session('Public', 'Scripts') as conn:
+            remotefiles = conn.list()
 
         return remotefiles
 
@@ -253,10 +320,8 @@ class NewportXPS:
            filename (str):  name of script file
         """
         filecontent = ""
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Public', 'Scripts'))
-        filecontent = self.ftpconn.getlines(filename)
-        self.ftpconn.close()
+        with self._ftp_session('Public', 'Scripts') as conn:
+            filecontent = conn.getlines(filename)
 
         return filecontent
 
@@ -267,10 +332,8 @@ class NewportXPS:
         ----------
            filename (str):  name of script file
         """
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Public', 'Scripts'))
-        self.ftpconn.save(filename, filename)
-        self.ftpconn.close()
+        with self._ftp_session('Public', 'Scripts') as conn:
+            conn.save(filename, filename)
 
     def upload_script(self, filename, text):
         """upload script file
@@ -280,10 +343,8 @@ class NewportXPS:
            filename (str):  name of script file
            text  (str):   full text of script file
         """
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Public', 'Scripts'))
-        self.ftpconn.put(clean_text(text), filename)
-        self.ftpconn.close()
+        with self._ftp_session('Public', 'Scripts') as conn:
+            conn.put(clean_text(text), filename)
 
     def delete_script(self, filename):
         """delete script file
@@ -292,10 +353,8 @@ class NewportXPS:
         ----------
            filename (str):  name of script file
         """
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Public', 'Scripts'))
-        self.ftpconn.delete(filename)
-        self.ftpconn.close()
+        with self._ftp_session('Public', 'Scripts') as conn:
+            conn.delete(filename)
 
     def upload_systemini(self, text):
         """upload text of system.ini
@@ -304,10 +363,8 @@ class NewportXPS:
         ----------
            text  (str):   full text of system.ini
         """
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Config'))
-        self.ftpconn.put(clean_text(text), 'system.ini')
-        self.ftpconn.close()
+        with self._ftp_session('Config') as conn:
+            conn.put(clean_text(text), 'system.ini')
 
     def upload_stagesini(self, text):
         """upload text of stages.ini
@@ -324,10 +381,8 @@ class NewportXPS:
           >>> xps.upload_stageini(text)
 
         """
-        self.ftpconn.connect(**self.ftpargs)
-        self.ftpconn.cwd(posixpath.join(self.ftphome, 'Config'))
-        self.ftpconn.put(clean_text(text), 'stages.ini')
-        self.ftpconn.close()
+        with self._ftp_session('Config') as conn:
+            conn.put(clean_text(text), 'stages.ini')
 
     @withConnectedXPS
     def set_tuning(self, stage, kp=None, ki=None, kd=None, ks=None,
@@ -426,8 +481,11 @@ class NewportXPS:
                 print(f"Warning: could not enable trajectory group '{self.traj_group}'")
                 return
 
-        for i in range(64):
-            self._xps.EventExtendedRemove(self._sid, i)
+        # clear all event slots in one pipelined burst: 64 sequential
+        # round-trips otherwise, and most slots return a harmless
+        # 'event not defined' error that we ignore as before
+        self._xps.Send_batch(self._sid,
+                             [f'EventExtendedRemove({i})' for i in range(64)])
 
         # build template for linear trajectory file:
         trajline1 = ['%(ramptime)f']
@@ -443,7 +501,6 @@ class NewportXPS:
         trajline1 = (','.join(trajline1)).strip()
         trajline2 = (','.join(trajline2)).strip()
         trajline3 = (','.join(trajline3)).strip()
-        self.linear_template = '\n'.join(['', trajline1, trajline2, trajline3])
         self.linear_template = '\n'.join(['', trajline1, trajline2, trajline3, ''])
 
 
@@ -451,14 +508,18 @@ class NewportXPS:
     def _group_act(self, method, group=None, action='doing something',
                    with_raise=True):
         """wrapper for many group actions"""
-        method = getattr(self._xps, method)
         if group is None:
-            for group in self.groups:
-                err, ret = method(self._sid, group)
+            # one pipelined burst for all groups: the controller runs
+            # the actions in order either way, but the commands go out
+            # in a single write instead of a round-trip per group
+            groups = list(self.groups)
+            cmds = [f'{method}({g})' for g in groups]
+            replies = self._xps.Send_batch(self._sid, cmds)
+            for group, (err, ret) in zip(groups, replies):
                 self.check_error(err, msg=f"{action} group '{group}'",
                                  with_raise=with_raise)
         elif group in self.groups:
-            err, ret = method(self._sid, group)
+            err, ret = getattr(self._xps, method)(self._sid, group)
             self.check_error(err, msg=f"%{action} group '{group}'",
                              with_raise=with_raise)
         else:
@@ -554,11 +615,12 @@ class NewportXPS:
         get dictionary of status for each group
         """
         out = {}
-        for group in self.groups:
-            err, stat = self._xps.GroupStatusGet(self._sid, group)
+        cmds = [f'GroupStatusGet({group},int *)' for group in self.groups]
+        replies = self._xps.Send_batch(self._sid, cmds)
+        for group, (err, stat) in zip(self.groups, replies):
             self.check_error(err, msg=f"GroupStatus '{group}'")
 
-            err, val = self._xps.GroupStatusStringGet(self._sid, stat)
+            err, val = self._xps.GroupStatusStringGet(self._sid, int(stat))
             self.check_error(err, msg=f"GroupStatusString '{stat}'")
 
             out[group] = val
@@ -570,13 +632,13 @@ class NewportXPS:
         get dictionary of hardware status for each stage
         """
         out = {}
-        for stage in self.stages:
-            if stage in ('', None):
-                continue
-            err, stat = self._xps.PositionerHardwareStatusGet(self._sid, stage)
+        stages = [s for s in self.stages if s not in ('', None)]
+        cmds = [f'PositionerHardwareStatusGet({stage},int *)' for stage in stages]
+        replies = self._xps.Send_batch(self._sid, cmds)
+        for stage, (err, stat) in zip(stages, replies):
             self.check_error(err, msg=f"Pos HardwareStatus '{stage}'")
 
-            err, val = self._xps.PositionerHardwareStatusStringGet(self._sid, stat)
+            err, val = self._xps.PositionerHardwareStatusStringGet(self._sid, int(stat))
             self.check_error(err, msg=f"Pos HardwareStatusString '{stat}'")
             out[stage] = val
         return out
@@ -587,13 +649,13 @@ class NewportXPS:
         get dictionary of positioner errors for each stage
         """
         out = {}
-        for stage in self.stages:
-            if stage in ('', None):
-                continue
-            err, stat = self._xps.PositionerErrorGet(self._sid, stage)
+        stages = [s for s in self.stages if s not in ('', None)]
+        cmds = [f'PositionerErrorGet({stage},int *)' for stage in stages]
+        replies = self._xps.Send_batch(self._sid, cmds)
+        for stage, (err, stat) in zip(stages, replies):
             self.check_error(err, msg=f"Pos Error '{stage}'")
 
-            err, val = self._xps.PositionerErrorStringGet(self._sid, stat)
+            err, val = self._xps.PositionerErrorStringGet(self._sid, int(stat))
             self.check_error(err, msg=f"Pos ErrorString '{stat}'")
 
             if len(val) < 1:
@@ -642,12 +704,14 @@ class NewportXPS:
         if group is None:
             print("Do have a group to move")
             return
-        posnames = [p.lower() for p in self.groups[group]['positioners']]
+        gconf = self.groups[group]
+        posnames = gconf.get('_positioners_lc')
+        if posnames is None:
+            posnames = tuple(p.lower() for p in gconf['positioners'])
+            gconf['_positioners_lc'] = posnames
         ret = self._xps.GroupPositionCurrentGet(self._sid, group, len(posnames))
 
-        kwargs = {}
-        for k, v in kws.items():
-            kwargs[k.lower()] = v
+        kwargs = {k.lower(): v for k, v in kws.items()}
 
         vals = []
         for i, p in enumerate(posnames):
@@ -657,6 +721,47 @@ class NewportXPS:
                 vals.append(ret[i+1])
         self._xps.GroupMoveAbsolute(self._sid, group, vals)
 
+    @withConnectedXPS
+    def move_group_many(self, positions, group=None):
+        """move group through a sequence of absolute positions
+
+        Parameters:
+            positions: sequence of setpoints, each giving one value per
+               positioner of the group, in the order of
+               self.groups[group]['positioners']
+            group (None or string): name of group to move [None, meaning
+               the current trajectory group]
+
+        All setpoints are checked against the stage travel limits in one
+        pass, then the moves are written to the socket back-to-back: the
+        controller queues each move while the previous one executes and
+        acknowledges them in order, so a scan pays the network round-trip
+        once for the whole sequence instead of per point.
+        """
+        if group is None or group not in self.groups:
+            group = self.traj_group
+        if group is None:
+            raise XPSException("no group to move")
+
+        posnames = self.groups[group]['positioners']
+        pos = np.atleast_2d(np.asarray(positions, dtype=float))
+        if pos.shape[1] != len(posnames):
+            raise ValueError(f"expected {len(posnames)} values per setpoint for group '{group}'")
+
+        for i, pname in enumerate(posnames):
+            lims = self.stages.get(f"{group}.{pname}", {})
+            low, high = lims.get('low_limit'), lims.get('high_limit')
+            if (low is not None and
+                (pos[:, i].min() < low or pos[:, i].max() > high)):
+                raise XPSException(f"setpoints out of travel limits for '{group}.{pname}'")
+
+        cmds = ['GroupMoveAbsolute(%s,%s)' % (group,
+                                              ','.join(str(v) for v in row))
+                for row in pos]
+        replies = self._xps.Send_batch(self._sid, cmds)
+        for n, (err, ret) in enumerate(replies):
+            self.check_error(err, msg=f"moving group '{group}' to point {n}")
+
     @withConnectedXPS
     def execute_script(self, script, task, arguments):
         """
@@ -958,16 +1063,17 @@ class NewportXPS:
                 'npulses': npulses+1, 'nsegments': npulses+1,
                 'uploaded': False}
 
-        buff = ['']
-
-        for n in range(npulses+1):
-            line = [f"{dtime:.8f}"]
-            for axes in all_axes:
-                p, v = pos[axes][n], velo[axes][n]
-                line.extend([f"{p:.8f}", f"{v:.8f}"])
-            buff.append(', '.join(line))
-        buff.append('')
-        buff  = '\n'.join(buff)
+        # emit all segments in one savetxt pass instead of formatting
+        # each value at the Python level: for long trajectories the
+        # serialization was the bottleneck once the math went to numpy
+        cols = [np.full(npulses+1, dtime)]
+        for axes in all_axes:
+            cols.append(pos[axes])
+            cols.append(velo[axes])
+        sbuff = StringIO()
+        np.savetxt(sbuff, np.column_stack(cols), fmt='%.8f',
+                   delimiter=', ', newline='\n')
+        buff = '\n' + sbuff.getvalue()
         traj['pvt_buffer'] = buff
 
         if upload:
@@ -26,8 +26,11 @@ def read_xps_file(fname):
     return data.decode(ENCODING)
 
 def clean_text(text):
-    buff = []
-    for line in text.split('\n'):
-        line = line.replace('\r', '').replace('\n', '') + ' '
-        buff.append(line)
-    return '\n'.join(buff)
+    """normalize line endings, padding each line with a trailing
+    space.  bytes input is cleaned as bytes and returned as bytes,
+    so uploads can skip the decode/encode round-trip"""
+    if isinstance(text, bytes):
+        return b'\n'.join(line.replace(b'\r', b'') + b' '
+                          for line in text.split(b'\n'))
+    return '\n'.join(line.replace('\r', '') + ' '
+                     for line in text.split('\n'))